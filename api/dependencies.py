@@ -17,7 +17,7 @@ ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24
 storage = SupabaseStorage()
 user_service = UserService(storage)
 crop_service = CropService(storage)
-crop_type_service = CropTypeService(storage, user_service)
+crop_type_service = CropTypeService(storage, user_service, crop_service)
 
 security = HTTPBearer()
 
@@ -0,0 +1,429 @@
+import math
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is an optional accelerator
+    njit = None
+
+try:
+    import jax
+    import jax.numpy as jnp
+except ImportError:  # pragma: no cover - jax is an optional accelerator
+    jax = None
+
+HAS_JAX = jax is not None
+
+# Crop-type fields stacked into per-crop vectors for the ensemble kernel,
+# in the order simulate_ensemble_jax expects them.
+ENSEMBLE_PARAM_NAMES = (
+    "optimal_temp",
+    "temperature_curve_length",
+    "water_stress_constant",
+    "water_opt_low",
+    "water_opt_high",
+    "water_capacity",
+    "needed_light",
+    "needed_light_max",
+    "light_km",
+    "light_sigma",
+    "phenological_initial_coefficient",
+    "phenological_mid_coefficient",
+    "phenological_end_coefficient",
+    "days_cycle",
+    "photosyntesis_max_rate",
+    "growth_breathing_coefficient",
+    "breathing_base_rate",
+    "activation_energy",
+    "theta",
+    "potential_performance",
+    "minimum_temp",
+    "maximum_temp",
+    "consecutive_stress_days_limit",
+)
+
+
+def simulate_ensemble_jax(params, state, temperatures, rains, sun_hours, irrigations):
+    """
+    Runs the growth model for a whole crop ensemble as a JIT-compiled
+    jax.lax.scan over the time axis, with crops as the batch dimension.
+    `params` maps ENSEMBLE_PARAM_NAMES to length-N arrays; `state` holds
+    the initial biomass/water/stress/days_done/processing vectors. The
+    weather arrays are (N, T). Returns the (N, T) biomass trajectory.
+
+    Mirrors CropService.simulate_batch day-for-day (including harvest,
+    cycle completion and mortality masking) but is purely functional:
+    nothing is persisted.
+    """
+    if jax is None:  # pragma: no cover - guarded by callers
+        raise ImportError("simulate_ensemble_jax requiere el paquete 'jax'.")
+
+    p = {key: jnp.asarray(value) for key, value in params.items()}
+    opt_temp_kelvin = 273.15 + p["optimal_temp"]
+    delta_temp = jnp.maximum(p["maximum_temp"] - p["minimum_temp"], 0.1)
+    light_normalization = p["needed_light"] / (p["needed_light"] + p["light_km"])
+    light_ceiling = jnp.exp(
+        -((p["needed_light_max"] - p["needed_light"]) ** 2)
+        / (2 * p["light_sigma"] ** 2)
+    )
+
+    def step(carry, weather_t):
+        biomass, water, stress, days_done, processing = carry
+        temp_t, rain_t, sun_t, irrigation_t = weather_t
+
+        f_T = jnp.exp(
+            -((temp_t - p["optimal_temp"]) ** 2)
+            / (2 * p["temperature_curve_length"] ** 2)
+        )
+        f_W = (
+            1
+            / (1 + jnp.exp(p["water_stress_constant"] * (p["water_opt_low"] - water)))
+        ) * (
+            1
+            / (1 + jnp.exp(p["water_stress_constant"] * (water - p["water_opt_high"])))
+        )
+        low_light = (sun_t / (sun_t + p["light_km"])) / light_normalization
+        mid_light = jnp.exp(
+            -((sun_t - p["needed_light"]) ** 2) / (2 * p["light_sigma"] ** 2)
+        )
+        f_L = jnp.minimum(
+            jnp.where(
+                sun_t <= p["needed_light"],
+                low_light,
+                jnp.where(sun_t <= p["needed_light_max"], mid_light, light_ceiling),
+            ),
+            1.0,
+        )
+
+        logistic_term = 1 - (biomass / p["potential_performance"]) ** p["theta"]
+        photosynthesis = (
+            p["photosyntesis_max_rate"] * biomass * logistic_term * f_T * f_W * f_L
+        )
+        h_T = jnp.exp(
+            (p["activation_energy"] / 8.314)
+            * ((1 / opt_temp_kelvin) - (1 / (273.15 + temp_t)))
+        )
+        respiration = (
+            p["growth_breathing_coefficient"] * photosynthesis
+            + p["breathing_base_rate"] * biomass * h_T
+        )
+        new_biomass = jnp.maximum(0.0, biomass + photosynthesis - respiration)
+
+        ro = (days_done + 1) / p["days_cycle"]
+        k_ini = p["phenological_initial_coefficient"]
+        k_mid = p["phenological_mid_coefficient"]
+        k_end = p["phenological_end_coefficient"]
+        rising = k_ini + (k_mid - k_ini) * ((ro - 0.15) / 0.25)
+        falling = k_mid + (k_end - k_mid) * ((ro - 0.85) / 0.15)
+        kc = jnp.where(
+            ro <= 0.15,
+            k_ini,
+            jnp.where(ro < 0.40, rising, jnp.where(ro <= 0.85, k_mid, falling)),
+        )
+        et0 = 0.0023 * (temp_t + 17.8) * jnp.sqrt(delta_temp)
+        et = kc * et0 * f_W
+        new_water = jnp.minimum(
+            water + rain_t + irrigation_t - et, p["water_capacity"]
+        )
+
+        f_total = f_T * f_W * f_L
+        new_stress = jnp.where(
+            f_total < 0.1, stress + 1, jnp.maximum(0, stress - 1)
+        )
+        died = processing & (
+            (new_stress >= p["consecutive_stress_days_limit"])
+            | ((water <= 0) & (new_stress > 3))
+        )
+        harvested = processing & (
+            new_biomass >= 0.95 * p["potential_performance"]
+        )
+        survivors = processing & ~died
+
+        biomass = jnp.where(survivors, new_biomass, biomass)
+        water = jnp.where(survivors, new_water, water)
+        stress = jnp.where(processing, new_stress, stress)
+        days_done = jnp.where(survivors, days_done + 1, days_done)
+        completed = survivors & (days_done >= p["days_cycle"])
+        processing = survivors & ~harvested & ~completed
+
+        return (biomass, water, stress, days_done, processing), biomass
+
+    initial = (
+        jnp.asarray(state["biomass"]),
+        jnp.asarray(state["water"]),
+        jnp.asarray(state["stress"]),
+        jnp.asarray(state["days_done"]),
+        jnp.asarray(state["processing"]),
+    )
+    weather = (
+        jnp.asarray(temperatures).T,
+        jnp.asarray(rains).T,
+        jnp.asarray(sun_hours).T,
+        jnp.asarray(irrigations).T,
+    )
+    _, history = jax.jit(lambda c, w: jax.lax.scan(step, c, w))(initial, weather)
+    return history.T
+
+
+def crop_coefficient_phase(ro, k_ini, k_mid, k_end):
+    """
+    Branchless phenological crop coefficient for an array of cycle
+    fractions `ro`; the arguments broadcast, so per-crop coefficient
+    vectors work as well as scalars. The three linear pieces are
+    evaluated with masks instead of if/elif so the expression stays a
+    single SIMD-friendly NumPy pass.
+    """
+    rising = k_ini + (k_mid - k_ini) * ((ro - 0.15) / 0.25)
+    falling = k_mid + (k_end - k_mid) * ((ro - 0.85) / 0.15)
+    return np.where(
+        ro <= 0.15,
+        k_ini,
+        np.where(ro < 0.40, rising, np.where(ro <= 0.85, k_mid, falling)),
+    )
+
+
+def _jit(function):
+    """
+    Compiles the function with Numba when it is installed; otherwise the
+    plain Python function is used, so the math stays identical either way.
+    """
+    if njit is not None:
+        return njit(cache=True, fastmath=True)(function)
+    return function
+
+
+@_jit
+def biomass_trajectory(
+    thermal_factors,
+    light_factors,
+    crop_coefficients,
+    et0_values,
+    temperatures,
+    rains,
+    irrigations,
+    initial_biomass: float,
+    initial_water: float,
+    initial_stress: float,
+    start_days_done: float,
+    optimal_temp: float,
+    water_stress_constant: float,
+    water_opt_low: float,
+    water_opt_high: float,
+    water_capacity: float,
+    photosyntesis_max_rate: float,
+    growth_breathing_coefficient: float,
+    breathing_base_rate: float,
+    activation_energy: float,
+    theta: float,
+    potential_performance: float,
+    stress_limit: float,
+    days_cycle: float,
+):
+    """
+    The sequential half of simulate_days: given the precomputed
+    weather-only factor arrays, iterates the biomass/water/stress
+    recurrence (which cannot vectorize because each day feeds the next)
+    at native speed under Numba, or in plain Python otherwise.
+
+    Returns (biomass_out, simulated_days, final_water, final_stress,
+    died, still_active); on death the dying day is not recorded,
+    matching simulate_day.
+    """
+    total_days = thermal_factors.shape[0]
+    biomass_out = np.empty(total_days, dtype=np.float64)
+
+    biomass = initial_biomass
+    water = initial_water
+    stress = initial_stress
+    simulated = 0
+    died = False
+    still_active = True
+    harvest_threshold = 0.95 * potential_performance
+    opt_kelvin = 273.15 + optimal_temp
+
+    for i in range(total_days):
+        f_T = thermal_factors[i]
+        f_L = light_factors[i]
+        f_W = (
+            1 / (1 + math.exp(water_stress_constant * (water_opt_low - water)))
+        ) * (1 / (1 + math.exp(water_stress_constant * (water - water_opt_high))))
+
+        if f_T == 0.0 or f_W == 0.0 or f_L == 0.0:
+            photosynthesis = 0.0
+        else:
+            ratio = biomass / potential_performance
+            if theta == 1.5:
+                logistic_term = 1 - ratio * math.sqrt(ratio)
+            else:
+                logistic_term = 1 - ratio**theta
+            photosynthesis = (
+                photosyntesis_max_rate * biomass * logistic_term * f_T * f_W * f_L
+            )
+
+        manteinance = (
+            breathing_base_rate
+            * biomass
+            * math.exp(
+                (activation_energy / 8.314)
+                * ((1 / opt_kelvin) - (1 / (273.15 + temperatures[i])))
+            )
+        )
+        respiration = growth_breathing_coefficient * photosynthesis + manteinance
+        biomass = max(0.0, biomass + photosynthesis - respiration)
+
+        evapotranspiration = crop_coefficients[i] * et0_values[i] * f_W
+        new_water = min(
+            water + rains[i] + irrigations[i] - evapotranspiration, water_capacity
+        )
+
+        harvested = biomass >= harvest_threshold
+
+        # Mortality bookkeeping, mirroring _check_mortality (the water
+        # check uses the pre-update level, and a dying day is discarded).
+        f_total = f_T * f_W * f_L
+        if f_total < 0.1:
+            stress += 1
+        else:
+            stress = max(0.0, stress - 1)
+        if stress >= stress_limit or (water <= 0 and stress > 3):
+            died = True
+            still_active = False
+            break
+
+        biomass_out[simulated] = biomass
+        water = new_water
+        simulated += 1
+
+        if harvested or start_days_done + simulated >= days_cycle:
+            still_active = False
+            break
+
+    return biomass_out, simulated, water, stress, died, still_active
+
+
+@_jit
+def daily_step(
+    temperature: float,
+    rain: float,
+    sun_hours: float,
+    irrigation: float,
+    water_stored: float,
+    current_biomass: float,
+    current_day: float,
+    optimal_temp: float,
+    temperature_curve_length: float,
+    water_stress_constant: float,
+    water_opt_low: float,
+    water_opt_high: float,
+    water_capacity: float,
+    needed_light: float,
+    needed_light_max: float,
+    light_km: float,
+    light_sigma: float,
+    phenological_initial_coefficient: float,
+    phenological_mid_coefficient: float,
+    phenological_end_coefficient: float,
+    days_cycle: float,
+    photosyntesis_max_rate: float,
+    growth_breathing_coefficient: float,
+    breathing_base_rate: float,
+    activation_energy: float,
+    theta: float,
+    potential_performance: float,
+    minimum_temp: float,
+    maximum_temp: float,
+):
+    """
+    One day of the growth model as pure scalar float math, outside any
+    dataclass, so Numba can compile it when available. Returns
+    (new_biomass, new_water_stored, f_T, f_W, f_L).
+
+    The formulas are the ones in CropService; keeping everything fused in
+    a single function removes per-call interpreter dispatch in the
+    day-by-day simulation path.
+    """
+    # Thermal factor for photosynthesis (Gaussian around the optimum).
+    sigma = temperature_curve_length
+    f_T = math.exp(-((temperature - optimal_temp) ** 2) / (2 * sigma**2))
+
+    # Water stress factor (double sigmoid penalizing deficit and excess).
+    f_W = (
+        1 / (1 + math.exp(water_stress_constant * (water_opt_low - water_stored)))
+    ) * (1 / (1 + math.exp(water_stress_constant * (water_stored - water_opt_high))))
+
+    # Light factor (Michaelis-Menten below optimum, Gaussian above it).
+    normalization = needed_light / (needed_light + light_km)
+    if sun_hours <= needed_light:
+        f_L_raw = sun_hours / (sun_hours + light_km)
+        f_L = f_L_raw / normalization if normalization > 0 else 0.0
+    elif sun_hours <= needed_light_max:
+        f_L = math.exp(
+            -((sun_hours - needed_light) ** 2) / (2 * (light_sigma**2))
+        )
+    else:
+        f_L = math.exp(
+            -((needed_light_max - needed_light) ** 2) / (2 * (light_sigma**2))
+        )
+    f_L = min(f_L, 1.0)
+
+    # Photosynthesis with the logistic carrying-capacity term. When any
+    # environmental factor underflows to exactly zero (deep cold snaps,
+    # bone-dry soil, no light) the product is zero regardless of the
+    # logistic term, so skip the pow entirely. The common theta of 1.5 is
+    # computed as x*sqrt(x): one hardware sqrt instead of a generic pow.
+    if f_T == 0.0 or f_W == 0.0 or f_L == 0.0:
+        photosynthesis = 0.0
+    else:
+        if potential_performance <= 0:
+            logistic_term = 1.0
+        else:
+            ratio = current_biomass / potential_performance
+            if theta == 1.5:
+                logistic_term = 1 - ratio * math.sqrt(ratio)
+            else:
+                logistic_term = 1 - ratio**theta
+        photosynthesis = (
+            photosyntesis_max_rate * current_biomass * logistic_term * f_T * f_W * f_L
+        )
+
+    # Growth + maintenance respiration (Arrhenius-style thermal response).
+    optimal_temperature_in_kelvin = 273.15 + optimal_temp
+    temperature_in_kelvin = 273.15 + temperature
+    manteinance = (
+        breathing_base_rate
+        * current_biomass
+        * math.exp(
+            (activation_energy / 8.314)
+            * ((1 / optimal_temperature_in_kelvin) - (1 / temperature_in_kelvin))
+        )
+    )
+    respiration = growth_breathing_coefficient * photosynthesis + manteinance
+    new_biomass = max(0.0, current_biomass + photosynthesis - respiration)
+
+    # Water balance via the Hargreaves reference evapotranspiration and
+    # the phenological crop coefficient.
+    delta_temp = max(maximum_temp - minimum_temp, 0.1)
+    et0 = 0.0023 * (temperature + 17.8) * math.sqrt(delta_temp)
+
+    ro = float(current_day) / float(days_cycle)
+    if ro <= 0.15:
+        kc = phenological_initial_coefficient
+    elif ro < 0.40:
+        kc = phenological_initial_coefficient + (
+            (phenological_mid_coefficient - phenological_initial_coefficient)
+            * ((ro - 0.15) / 0.25)
+        )
+    elif ro <= 0.85:
+        kc = phenological_mid_coefficient
+    else:
+        kc = phenological_mid_coefficient + (
+            (phenological_end_coefficient - phenological_mid_coefficient)
+            * ((ro - 0.85) / 0.15)
+        )
+
+    evapotranspiration = kc * et0 * f_W
+    water_temp = water_stored + rain + irrigation - evapotranspiration
+    new_water_stored = min(water_temp, water_capacity)
+
+    return new_biomass, new_water_stored, f_T, f_W, f_L
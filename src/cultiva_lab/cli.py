@@ -69,7 +69,7 @@ def print_logo():
 storage = JSONStorage()
 user_service = UserService(storage)
 crop_service = CropService(storage)
-crop_type_service = CropTypeService(storage, user_service)
+crop_type_service = CropTypeService(storage, user_service, crop_service)
 
 # Variable global para el usuario logueado
 current_user = None
@@ -1,5 +1,9 @@
 from dataclasses import dataclass
 from datetime import datetime
+from operator import attrgetter
+
+import numpy as np
+
 from .daily_condition import DailyCondition
 from src.cultiva_lab.exceptions import InvalidInputError
 
@@ -40,6 +44,115 @@ class Crop:
         self._validate_consecutive_stress_days()
         self._validate_current_phase()
         self._validate_active()
+        self._condition_buffers: dict[str, np.ndarray] | None = None
+        self._buffered_days: int = 0
+
+    _CONDITION_CHANNELS = ("temperature", "rain", "sun_hours", "estimated_biomass")
+    # C-level attribute readers: map(attrgetter(...), conditions) skips
+    # the per-element generator frame when filling a column.
+    _CHANNEL_GETTERS = {
+        channel: attrgetter(channel) for channel in _CONDITION_CHANNELS
+    }
+
+    def latest_biomass(self, default: float) -> float:
+        """
+        Returns the last simulated biomass, or the given default when no
+        day has been simulated yet.
+        """
+
+        if self.conditions:
+            return self.conditions[-1].estimated_biomass
+        return default
+
+    def _ensure_buffer_capacity(self, needed: int) -> None:
+        """
+        Grows the preallocated channel buffers by doubling, so appends
+        amortize to zero allocation per simulated day.
+        """
+
+        if self._condition_buffers is None:
+            capacity = max(16, needed)
+            self._condition_buffers = {
+                channel: np.zeros(capacity, dtype=np.float64)
+                for channel in self._CONDITION_CHANNELS
+            }
+            return
+
+        capacity = len(self._condition_buffers["estimated_biomass"])
+        if needed > capacity:
+            new_capacity = max(capacity * 2, needed)
+            for channel, buffer in self._condition_buffers.items():
+                grown = np.zeros(new_capacity, dtype=np.float64)
+                grown[:capacity] = buffer
+                self._condition_buffers[channel] = grown
+
+    def append_condition(self, condition: DailyCondition) -> None:
+        """
+        Appends a simulated day, keeping the SoA buffers in sync with a
+        single float write per channel (no rebuild).
+        """
+
+        self.conditions.append(condition)
+        if self._buffered_days != len(self.conditions) - 1:
+            # The list was modified behind our back; let the next
+            # condition_arrays() call resynchronize.
+            return
+        self._ensure_buffer_capacity(len(self.conditions))
+        cursor = self._buffered_days
+        for channel in self._CONDITION_CHANNELS:
+            self._condition_buffers[channel][cursor] = getattr(condition, channel)
+        self._buffered_days += 1
+
+    def extend_conditions(self, conditions: list[DailyCondition]) -> None:
+        """
+        Bulk append for the batched simulation paths: writes every new
+        day straight into the SoA buffers, one slot per channel, without
+        triggering a full resynchronization later.
+        """
+
+        if self._buffered_days != len(self.conditions):
+            # Buffers already stale; plain extend and let the next
+            # condition_arrays() call rebuild once.
+            self.conditions.extend(conditions)
+            return
+
+        self.conditions.extend(conditions)
+        self._ensure_buffer_capacity(len(self.conditions))
+        cursor = self._buffered_days
+        for condition in conditions:
+            for channel in self._CONDITION_CHANNELS:
+                self._condition_buffers[channel][cursor] = getattr(
+                    condition, channel
+                )
+            cursor += 1
+        self._buffered_days = cursor
+
+    def condition_arrays(self) -> dict[str, np.ndarray]:
+        """
+        Structure-of-arrays view over the daily conditions: one contiguous
+        float64 array per channel, so aggregations and vectorized math do
+        not have to chase one DailyCondition object per day.
+
+        Days appended through append_condition are written straight into
+        preallocated buffers; anything else (bulk extends, external list
+        edits) triggers a one-off resynchronization here.
+        """
+
+        total_days = len(self.conditions)
+        if self._condition_buffers is None or self._buffered_days != total_days:
+            self._ensure_buffer_capacity(total_days)
+            for channel, getter in self._CHANNEL_GETTERS.items():
+                self._condition_buffers[channel][:total_days] = np.fromiter(
+                    map(getter, self.conditions),
+                    dtype=np.float64,
+                    count=total_days,
+                )
+            self._buffered_days = total_days
+
+        return {
+            channel: buffer[:total_days]
+            for channel, buffer in self._condition_buffers.items()
+        }
 
     def _validate_name(self):
         """
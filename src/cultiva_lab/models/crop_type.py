@@ -1,4 +1,6 @@
+import math
 from dataclasses import dataclass
+
 from src.cultiva_lab.exceptions import InvalidInputError
 
 
@@ -103,6 +105,35 @@ class CropType:
         self._validate_activation_energy()
         self._validate_initial_biomass()
         self._validate_potential_performance()
+        self._compute_derived()
+
+    def _compute_derived(self):
+        """
+        Precomputes the reciprocals the growth math divides by on every
+        simulated day, so the hot paths multiply instead. Must be called
+        again after an admin mutates the underlying fields.
+
+        These are plain attributes (not dataclass fields) so they stay out
+        of the serialized form.
+        """
+
+        self.inv_days_cycle = 1.0 / self.days_cycle
+        self.inv_potential_performance = (
+            1.0 / self.potential_performance if self.potential_performance > 0 else 0.0
+        )
+        self.inv_two_temp_sigma_sq = 1.0 / (2 * self.temperature_curve_length**2)
+        self.inv_two_light_sigma_sq = 1.0 / (2 * self.light_sigma**2)
+        normalization = self.needed_light / (self.needed_light + self.light_km)
+        self.inv_light_normalization = (
+            1.0 / normalization if normalization > 0 else 0.0
+        )
+        self.activation_over_gas_constant = self.activation_energy / 8.314
+        self.inv_optimal_temp_kelvin = 1.0 / (273.15 + self.optimal_temp)
+        # Hargreaves ET0 = 0.0023 * (T + 17.8) * sqrt(delta_temp); the
+        # temperature-independent part is constant per crop type.
+        self.et0_coefficient = 0.0023 * math.sqrt(
+            max(self.maximum_temp - self.minimum_temp, 0.1)
+        )
 
     def _validate_id(self):
         """
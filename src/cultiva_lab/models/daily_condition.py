@@ -2,11 +2,15 @@ from dataclasses import dataclass
 from src.cultiva_lab.exceptions import InvalidInputError
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DailyCondition:
     """
     A DailyCondition class, where the User can fill out
     the day condition in each day to simule.
+
+    Slots and frozen: a simulated day is never mutated afterwards, and
+    dropping the per-instance __dict__ makes long condition histories
+    noticeably lighter.
     """
 
     day: int
@@ -3,11 +3,13 @@ from enum import Enum
 from src.cultiva_lab.exceptions import InvalidInputError
 
 
-@dataclass
-class UserRole(Enum):
+class UserRole(str, Enum):
     """
-    UserRole Dataclass implementation, inherits from Enum Module.
-    Allows the differentiation between the two profile types.
+    UserRole enumeration that allows the differentiation between the
+    two profile types. The str mixin makes members compare directly
+    against their stored values and serialize without conversion; the
+    previous @dataclass decorator was a no-op on an Enum and only added
+    class-creation overhead.
     """
 
     ADMIN = "admin"
@@ -15,10 +17,12 @@ class UserRole(Enum):
     # Class constants
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     """
     User Dataclass implementation, with its respective attributes.
+    Slots (no __dict__) keep attribute access fast and instances small;
+    username/password updates still mutate declared fields normally.
     """
 
     id: str
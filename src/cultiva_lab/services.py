@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 from src.cultiva_lab.models import User, Crop, CropType, DailyCondition, UserRole
 from .storage import Database
 from src.cultiva_lab.exceptions import (
@@ -13,12 +15,64 @@ from src.cultiva_lab.exceptions import (
     BusinessRuleViolationError,
 )
 from datetime import datetime, timedelta
-import uuid
+import hashlib
+import os
+import secrets
+import time
 import bcrypt
 import math
 
+import numpy as np
+
+from src.cultiva_lab import _kernels
+from src.cultiva_lab._kernels import crop_coefficient_phase, daily_step
+
 MASTER_KEY = "admin12345"
 
+# Crop fields a user may change through update_crops.
+_CROP_UPDATABLE_FIELDS = frozenset({"name", "active"})
+
+# bcrypt.checkpw is deliberately slow (a full KDF per call), so verified
+# (hash, password) pairs are remembered for a short window: a burst of
+# legitimate requests from the same session pays the KDF once. Keys use
+# the SHA-256 digest of the password, never the plaintext, and include a
+# time bucket so entries expire on their own.
+_VERIFY_CACHE: dict[tuple, bool] = {}
+_VERIFY_CACHE_MAX = 1024
+_VERIFY_TTL_SECONDS = 300
+
+# KDF cost, read once: deployments tune it via the environment instead
+# of editing code. bcrypt's default of 12 stays the default here.
+_BCRYPT_ROUNDS = int(os.environ.get("CULTIVALAB_BCRYPT_ROUNDS", "12"))
+
+
+def _hash_password(password: str) -> str:
+    """
+    Hashes a password with the module-wide bcrypt cost; the single place
+    that decides how expensive the KDF is.
+    """
+    return bcrypt.hashpw(
+        password.encode("utf-8"), bcrypt.gensalt(rounds=_BCRYPT_ROUNDS)
+    ).decode("utf-8")
+
+
+def _verify_password(password: str, stored_hash: str) -> bool:
+    """
+    bcrypt.checkpw with memoization of successful checks; failures are
+    never cached, so wrong passwords always pay the full KDF cost.
+    """
+    bucket = int(time.time() // _VERIFY_TTL_SECONDS)
+    key = (stored_hash, hashlib.sha256(password.encode("utf-8")).digest(), bucket)
+    if _VERIFY_CACHE.get(key):
+        return True
+
+    verified = bcrypt.checkpw(password.encode("utf-8"), stored_hash.encode("utf-8"))
+    if verified:
+        if len(_VERIFY_CACHE) >= _VERIFY_CACHE_MAX:
+            _VERIFY_CACHE.clear()
+        _VERIFY_CACHE[key] = True
+    return verified
+
 
 class CropService:
     """
@@ -29,6 +83,29 @@ class CropService:
 
     def __init__(self, storage: Database) -> None:
         self.storage: Database = storage
+        self._crop_type_cache: dict[str, CropType] = {}
+        self._pending_crops: dict[str, Crop] = {}
+        self._pending_conditions: list[tuple[str, DailyCondition]] = []
+
+    def flush(self) -> None:
+        """
+        Persists every crop simulated with commit=False in one bulk
+        write, plus their buffered daily conditions.
+        """
+        if not self._pending_crops:
+            return
+        self.storage.save_crops_bulk(list(self._pending_crops.values()))
+        for crop_id, condition in self._pending_conditions:
+            self.storage.save_daily_condition(crop_id, condition)
+        self._pending_crops.clear()
+        self._pending_conditions.clear()
+
+    def invalidate_crop_type(self, crop_type_id: str) -> None:
+        """
+        Drops a crop type from the service cache; must be called after an
+        admin edits or deletes the type so simulations see fresh values.
+        """
+        self._crop_type_cache.pop(crop_type_id, None)
 
     def _calculate_production_thermal_factor(
         self, crop_type: CropType, temperature: float
@@ -38,8 +115,10 @@ class CropService:
         Peak at optimal_temp, decreases as temperature deviates.
         """
 
-        sigma = crop_type.temperature_curve_length
-        return math.exp(-((temperature - crop_type.optimal_temp) ** 2) / (2 * sigma**2))
+        return math.exp(
+            -((temperature - crop_type.optimal_temp) ** 2)
+            * crop_type.inv_two_temp_sigma_sq
+        )
 
     def _calculate_water_factor_production(
         self, crop_type: CropType, water_stored: float
@@ -78,22 +157,18 @@ class CropService:
         Michaelis-Menten for low light, Gaussian for excess.
         """
 
-        normalization = crop_type.needed_light / (
-            crop_type.needed_light + crop_type.light_km
-        )
-
         if sun_hours <= crop_type.needed_light:
             f_L_raw = sun_hours / (sun_hours + crop_type.light_km)
-            f_L = f_L_raw / normalization if normalization > 0 else 0.0
+            f_L = f_L_raw * crop_type.inv_light_normalization
         elif crop_type.needed_light < sun_hours <= crop_type.needed_light_max:
             f_L = math.exp(
                 -((sun_hours - crop_type.needed_light) ** 2)
-                / (2 * (crop_type.light_sigma**2))
+                * crop_type.inv_two_light_sigma_sq
             )
         else:
             f_L = math.exp(
                 -((crop_type.needed_light_max - crop_type.needed_light) ** 2)
-                / (2 * (crop_type.light_sigma**2))
+                * crop_type.inv_two_light_sigma_sq
             )
 
         return min(f_L, 1.0)
@@ -123,10 +198,13 @@ class CropService:
         """
         Logistic term for carrying capacity.
         """
-        K = crop_type.potential_performance
-        if K <= 0:
+        if crop_type.potential_performance <= 0:
             return 1.0
-        return 1 - (biomass / K) ** crop_type.theta
+        ratio = biomass * crop_type.inv_potential_performance
+        if crop_type.theta == 1.5:
+            # x * sqrt(x) is pow(x, 1.5) without the generic pow call.
+            return 1 - ratio * math.sqrt(ratio)
+        return 1 - ratio**crop_type.theta
 
     def _calculate_photosynthesis(
         self,
@@ -167,15 +245,13 @@ class CropService:
         self, crop_type: CropType, biomass: float, temperature: float
     ) -> float:
         temperature_in_kelvin = 273.15 + temperature
-        optimal_temperature_in_kelvin = 273.15 + crop_type.optimal_temp
-        E_a = crop_type.activation_energy
 
         manteinance_respiration_part = (
             crop_type.breathing_base_rate
             * biomass
             * math.exp(
-                (E_a / 8.314)
-                * ((1 / optimal_temperature_in_kelvin) - (1 / temperature_in_kelvin))
+                crop_type.activation_over_gas_constant
+                * (crop_type.inv_optimal_temp_kelvin - (1 / temperature_in_kelvin))
             )
         )
         return manteinance_respiration_part
@@ -220,8 +296,7 @@ class CropService:
         """
         Reference evapotranspiration using Hargreaves method.
         """
-        delta_temp = max(crop_type.maximum_temp - crop_type.minimum_temp, 0.1)
-        return 0.0023 * (temperature + 17.8) * math.sqrt(delta_temp)
+        return crop_type.et0_coefficient * (temperature + 17.8)
 
     def _calculate_crop_coefficient_phase(
         self, crop_type: CropType, current_day: int
@@ -229,7 +304,7 @@ class CropService:
         """
         Crop coefficient based on phenological phase.
         """
-        ro = current_day / crop_type.days_cycle
+        ro = current_day * crop_type.inv_days_cycle
         if ro <= 0.15:
             return crop_type.phenological_initial_coefficient
         elif 0.15 < ro < 0.40:
@@ -306,6 +381,88 @@ class CropService:
             return True
         return False
 
+    def _simulate_day_inplace(
+        self,
+        crop: Crop,
+        crop_type: CropType,
+        temperature: float,
+        rain: float,
+        sun_hours: float,
+        irrigation: float = 0.0,
+    ) -> DailyCondition:
+        """
+        Runs one day of the growth model on an already-fetched crop,
+        mutating it without persisting anything; callers decide when to
+        save, so multi-day runs pay a single storage write.
+
+        Raises InvalidInputError (without saving) if the plant dies.
+        """
+        # Day counter and current biomass, read once for the whole step.
+        current_day = len(crop.conditions) + 1
+        current_biomass = crop.latest_biomass(crop_type.initial_biomass)
+
+        # The whole day of factor / growth / water math runs in one fused
+        # scalar kernel (Numba-compiled when available).
+        new_biomass, new_water_stored, f_T, f_W, f_L = daily_step(
+            temperature,
+            rain,
+            sun_hours,
+            irrigation,
+            crop.water_stored,
+            current_biomass,
+            float(current_day),
+            crop_type.optimal_temp,
+            crop_type.temperature_curve_length,
+            crop_type.water_stress_constant,
+            crop_type.water_opt_low,
+            crop_type.water_opt_high,
+            crop_type.water_capacity,
+            crop_type.needed_light,
+            crop_type.needed_light_max,
+            crop_type.light_km,
+            crop_type.light_sigma,
+            crop_type.phenological_initial_coefficient,
+            crop_type.phenological_mid_coefficient,
+            crop_type.phenological_end_coefficient,
+            float(crop_type.days_cycle),
+            crop_type.photosyntesis_max_rate,
+            crop_type.growth_breathing_coefficient,
+            crop_type.breathing_base_rate,
+            crop_type.activation_energy,
+            crop_type.theta,
+            crop_type.potential_performance,
+            crop_type.minimum_temp,
+            crop_type.maximum_temp,
+        )
+
+        # Harvest
+        if new_biomass >= 0.95 * crop_type.potential_performance:
+            crop.active = False
+
+        # Mortality
+        if self._check_mortality(
+            crop, crop_type, f_T, f_W, f_L, temperature, crop.water_stored
+        ):
+            crop.active = False
+            raise InvalidInputError("The plant has died due to extreme conditions.")
+
+        # Daily record
+        new_condition = DailyCondition(
+            day=current_day,
+            temperature=temperature,
+            rain=rain,
+            sun_hours=sun_hours,
+            estimated_biomass=new_biomass,
+        )
+
+        crop.append_condition(new_condition)
+        crop.water_stored = new_water_stored
+
+        if current_day >= crop_type.days_cycle:
+            crop.active = False
+
+        return new_condition
+
     def simulate_day(
         self,
         crop_id: str,
@@ -314,88 +471,577 @@ class CropService:
         rain: float,
         sun_hours: float,
         irrigation: float = 0.0,
+        commit: bool = True,
     ) -> Crop:
         """
         Simulates one day of growth for a crop.
+
+        With commit=False nothing is written to storage; the day is
+        queued on the service and persisted by the next flush() call, so
+        a caller stepping through many days pays one bulk write.
         """
         self._validate_environmental_inputs(temperature, rain, sun_hours, irrigation)
 
+        # A crop with unflushed deferred days must be continued from its
+        # pending state, not re-fetched from storage (which still holds
+        # the pre-deferral version).
+        crop = self._pending_crops.get(crop_id)
+        if crop is not None:
+            crop_type = self._get_crop_type(crop.crop_type_id)
+        else:
+            crop, crop_type = self.storage.get_crop_and_type(crop_id)
+        if not crop:
+            raise CropNotFoundError(crop_id)
+        if not crop.active:
+            raise InvalidInputError("El cultivo ya está cosechado.")
+        if crop.user_id != user_id:
+            raise ResourceOwnershipError("No puedes simular este cultivo.")
+        if not crop_type:
+            raise CropTypeNotFoundError(crop.crop_type_id)
+
+        try:
+            new_condition = self._simulate_day_inplace(
+                crop, crop_type, temperature, rain, sun_hours, irrigation
+            )
+        except InvalidInputError:
+            # Death: persist the inactive crop before surfacing the error.
+            if commit:
+                self.storage.save_crop(crop)
+            else:
+                self._pending_crops[crop.id] = crop
+            raise
+
+        crop.last_sim_date += timedelta(days=1)
+        if commit:
+            self.storage.save_crop(crop)
+            self.storage.save_daily_condition(crop.id, new_condition)
+        else:
+            self._pending_crops[crop.id] = crop
+            self._pending_conditions.append((crop.id, new_condition))
+        return crop
+
+    def simulate_range(
+        self,
+        crop_id: str,
+        user_id: str,
+        weather: list[tuple],
+    ) -> Crop:
+        """
+        Simulates a list of (temperature, rain, sun_hours[, irrigation])
+        days in-process and persists the crop exactly once at the end,
+        instead of writing to storage after every day.
+        """
+        if not weather:
+            raise InvalidInputError("Las series de clima no pueden estar vacías.")
+
+        normalized = []
+        for entry in weather:
+            temperature, rain, sun_hours = entry[0], entry[1], entry[2]
+            irrigation = entry[3] if len(entry) > 3 else 0.0
+            self._validate_environmental_inputs(
+                temperature, rain, sun_hours, irrigation
+            )
+            normalized.append((temperature, rain, sun_hours, irrigation))
+
         crop = self._get_and_validate_crop(crop_id, user_id)
         crop_type = self._get_crop_type(crop.crop_type_id)
 
-        if not crop.active:
-            raise InvalidInputError("El cultivo ya fue cosechado o está muerto.")
+        # The cycle length is a loop invariant: clamp the horizon up front
+        # instead of re-checking the day counter on every iteration.
+        remaining = crop_type.days_cycle - len(crop.conditions)
+        if remaining <= 0:
+            raise InvalidInputError("El cultivo ya completó su ciclo.")
+        normalized = normalized[:remaining]
+
+        new_conditions: list[DailyCondition] = []
+        died = False
+        simulate_inplace = self._simulate_day_inplace
+        record_condition = new_conditions.append
+        for temperature, rain, sun_hours, irrigation in normalized:
+            try:
+                record_condition(
+                    simulate_inplace(
+                        crop, crop_type, temperature, rain, sun_hours, irrigation
+                    )
+                )
+            except InvalidInputError:
+                died = True
+                break
+            if not crop.active:
+                break
+
+        # One datetime addition for the whole range instead of one
+        # timedelta allocation per simulated day.
+        crop.last_sim_date += timedelta(days=len(new_conditions))
+        self.storage.save_crop(crop)
+        for condition in new_conditions:
+            self.storage.save_daily_condition(crop.id, condition)
 
-        # Environmental factors
-        f_T = self._calculate_production_thermal_factor(crop_type, temperature)
-        f_W = self._calculate_water_factor_production(crop_type, crop.water_stored)
-        f_L = self._calculate_light_production_factor(crop_type, sun_hours)
+        if died:
+            raise InvalidInputError("The plant has died due to extreme conditions.")
+        return crop
+
+    def _vector_thermal_factors(
+        self, crop_type: CropType, temperatures: np.ndarray
+    ) -> np.ndarray:
+        """
+        Vectorized version of the Gaussian thermal factor for
+        a whole array of daily temperatures.
+        """
 
-        # Current biomass
-        current_biomass = (
-            crop.conditions[-1].estimated_biomass
-            if crop.conditions
-            else crop_type.initial_biomass
+        return np.exp(
+            -((temperatures - crop_type.optimal_temp) ** 2)
+            * crop_type.inv_two_temp_sigma_sq
         )
 
-        # Photosynthesis
-        logistic_term = self._calculate_logistic_growth_term(crop_type, current_biomass)
-        photosynthesis = self._calculate_photosynthesis(
-            crop_type, current_biomass, logistic_term, f_T, f_W, f_L
+    def _vector_light_factors(
+        self, crop_type: CropType, sun_hours: np.ndarray
+    ) -> np.ndarray:
+        """
+        Vectorized version of the piecewise light factor (Michaelis-Menten
+        below the optimum, Gaussian above it) for an array of sun hours.
+        """
+
+        low = (
+            sun_hours / (sun_hours + crop_type.light_km)
+        ) * crop_type.inv_light_normalization
+        mid = np.exp(
+            -((sun_hours - crop_type.needed_light) ** 2)
+            * crop_type.inv_two_light_sigma_sq
+        )
+        high = math.exp(
+            -((crop_type.needed_light_max - crop_type.needed_light) ** 2)
+            * crop_type.inv_two_light_sigma_sq
         )
 
-        # Net growth
-        net_growth = self._calculate_net_growth(
-            crop_type, current_biomass, photosynthesis, temperature
+        factors = np.where(
+            sun_hours <= crop_type.needed_light,
+            low,
+            np.where(sun_hours <= crop_type.needed_light_max, mid, high),
         )
-        new_biomass = max(0.0, current_biomass + net_growth)
-
-        # Water balance
-        et0 = self._calculate_evapotranspiration_reference(crop_type, temperature)
-        kc = self._calculate_crop_coefficient_phase(crop_type, len(crop.conditions) + 1)
-        et = self._calculate_evapotranspiration(crop_type, kc, et0, f_W)
-        new_water_stored, drainage = self._update_water_balance(
-            crop, crop_type, rain, irrigation, et
+        return np.minimum(factors, 1.0)
+
+    def _vector_crop_coefficients(
+        self, crop_type: CropType, days: np.ndarray
+    ) -> np.ndarray:
+        """
+        Vectorized version of the phenological crop coefficient for
+        an array of (1-based) simulation days.
+        """
+
+        return crop_coefficient_phase(
+            days * crop_type.inv_days_cycle,
+            crop_type.phenological_initial_coefficient,
+            crop_type.phenological_mid_coefficient,
+            crop_type.phenological_end_coefficient,
         )
 
-        # Harvest
-        if new_biomass >= 0.95 * crop_type.potential_performance:
-            crop.active = False
+    def simulate_days(
+        self,
+        crop_id: str,
+        user_id: str,
+        temperatures,
+        rains,
+        sun_hours,
+        irrigations=None,
+    ) -> Crop:
+        """
+        Simulates a whole sequence of days for a crop in one call.
 
-        # Mortality
-        if self._check_mortality(
-            crop, crop_type, f_T, f_W, f_L, temperature, crop.water_stored
+        The purely weather-dependent factors (thermal, light, reference
+        evapotranspiration and phenological coefficients) are precomputed
+        as NumPy arrays; only the water / biomass recurrence stays in a
+        day-by-day loop, and the crop is persisted a single time at the end.
+        """
+        temperatures = np.asarray(temperatures, dtype=np.float64)
+        rains = np.asarray(rains, dtype=np.float64)
+        sun_hours = np.asarray(sun_hours, dtype=np.float64)
+        if irrigations is None:
+            irrigations = np.zeros_like(temperatures)
+        else:
+            irrigations = np.asarray(irrigations, dtype=np.float64)
+
+        if not (
+            temperatures.shape == rains.shape == sun_hours.shape == irrigations.shape
         ):
-            crop.active = False
-            self.storage.save_crop(crop)
-            raise InvalidInputError("The plant has died due to extreme conditions.")
+            raise InvalidInputError(
+                "Las series de clima deben tener la misma longitud."
+            )
+        if temperatures.ndim != 1 or temperatures.size == 0:
+            raise InvalidInputError("Las series de clima no pueden estar vacías.")
 
-        # Save daily record
-        new_condition = DailyCondition(
-            day=len(crop.conditions) + 1,
-            temperature=temperature,
-            rain=rain,
-            sun_hours=sun_hours,
-            estimated_biomass=new_biomass,
+        self._validate_weather_arrays(temperatures, rains, sun_hours, irrigations)
+
+        crop = self._get_and_validate_crop(crop_id, user_id)
+        crop_type = self._get_crop_type(crop.crop_type_id)
+
+        if not crop.active:
+            raise InvalidInputError("El cultivo ya fue cosechado o está muerto.")
+
+        total_days = temperatures.size
+        start_day = len(crop.conditions) + 1
+        days = np.arange(start_day, start_day + total_days, dtype=np.float64)
+
+        # Weather-only factors, computed for the whole horizon at once.
+        thermal_factors = self._vector_thermal_factors(crop_type, temperatures)
+        light_factors = self._vector_light_factors(crop_type, sun_hours)
+        crop_coefficients = self._vector_crop_coefficients(crop_type, days)
+        et0_values = crop_type.et0_coefficient * (temperatures + 17.8)
+
+        current_biomass = crop.latest_biomass(crop_type.initial_biomass)
+
+        # The sequential recurrence runs in the jittable kernel; only
+        # condition materialization and persistence stay up here.
+        (
+            trajectory,
+            simulated,
+            final_water,
+            final_stress,
+            died,
+            still_active,
+        ) = _kernels.biomass_trajectory(
+            thermal_factors,
+            light_factors,
+            crop_coefficients,
+            et0_values,
+            temperatures,
+            rains,
+            irrigations,
+            current_biomass,
+            crop.water_stored,
+            float(crop.consecutive_stress_days),
+            float(len(crop.conditions)),
+            crop_type.optimal_temp,
+            crop_type.water_stress_constant,
+            crop_type.water_opt_low,
+            crop_type.water_opt_high,
+            crop_type.water_capacity,
+            crop_type.photosyntesis_max_rate,
+            crop_type.growth_breathing_coefficient,
+            crop_type.breathing_base_rate,
+            crop_type.activation_energy,
+            crop_type.theta,
+            crop_type.potential_performance,
+            float(crop_type.consecutive_stress_days_limit),
+            float(crop_type.days_cycle),
         )
 
-        crop.conditions.append(new_condition)
-        crop.last_sim_date += timedelta(days=1)
-        crop.water_stored = new_water_stored
+        crop.water_stored = float(final_water)
+        crop.consecutive_stress_days = int(final_stress)
+        if crop.active:
+            crop.active = bool(still_active)
+
+        biomass_list = trajectory[:simulated].tolist()
+        temps_list = temperatures[:simulated].tolist()
+        rains_list = rains[:simulated].tolist()
+        suns_list = sun_hours[:simulated].tolist()
+        new_conditions = [
+            DailyCondition(
+                day=start_day + i,
+                temperature=temps_list[i],
+                rain=rains_list[i],
+                sun_hours=suns_list[i],
+                estimated_biomass=biomass_list[i],
+            )
+            for i in range(simulated)
+        ]
 
-        if len(crop.conditions) >= crop_type.days_cycle:
-            crop.active = False
+        crop.extend_conditions(new_conditions)
+        crop.last_sim_date += timedelta(days=simulated)
 
         self.storage.save_crop(crop)
-        self.storage.save_daily_condition(crop.id, new_condition)
+        for condition in new_conditions:
+            self.storage.save_daily_condition(crop.id, condition)
+
+        if died:
+            raise InvalidInputError("The plant has died due to extreme conditions.")
         return crop
 
+    def _prepare_batch(
+        self,
+        crop_ids: list[str],
+        temperatures,
+        rains,
+        sun_hours,
+        irrigations=None,
+    ):
+        """
+        Shared front half of the batched simulations: fetches the crops
+        with their types, broadcasts the weather to (N, T) and validates
+        every value with one vectorized comparison per bound.
+        """
+        if not crop_ids:
+            raise InvalidInputError("La lista de cultivos no puede estar vacía.")
+
+        temperatures = np.atleast_2d(np.asarray(temperatures, dtype=np.float64))
+        rains = np.atleast_2d(np.asarray(rains, dtype=np.float64))
+        sun_hours = np.atleast_2d(np.asarray(sun_hours, dtype=np.float64))
+        if irrigations is None:
+            irrigations = np.zeros_like(temperatures)
+        else:
+            irrigations = np.atleast_2d(np.asarray(irrigations, dtype=np.float64))
+
+        n_crops = len(crop_ids)
+        total_days = temperatures.shape[-1]
+        if total_days == 0:
+            raise InvalidInputError("Las series de clima no pueden estar vacías.")
+        try:
+            temperatures = np.broadcast_to(temperatures, (n_crops, total_days))
+            rains = np.broadcast_to(rains, (n_crops, total_days))
+            sun_hours = np.broadcast_to(sun_hours, (n_crops, total_days))
+            irrigations = np.broadcast_to(irrigations, (n_crops, total_days))
+        except ValueError:
+            raise InvalidInputError(
+                "Las series de clima no coinciden con la cantidad de cultivos."
+            )
+
+        self._validate_weather_arrays(temperatures, rains, sun_hours, irrigations)
+
+        crops: list[Crop] = []
+        crop_types: list[CropType] = []
+        for crop_id in crop_ids:
+            crop = self.storage.get_crop_by_id(crop_id)
+            if not crop:
+                raise CropNotFoundError(crop_id)
+            crops.append(crop)
+            crop_types.append(self._get_crop_type(crop.crop_type_id))
+
+        return crops, crop_types, temperatures, rains, sun_hours, irrigations
+
+    def simulate_batch_jax(
+        self,
+        crop_ids: list[str],
+        temperatures,
+        rains,
+        sun_hours,
+        irrigations=None,
+    ) -> np.ndarray:
+        """
+        What-if preview of simulate_batch on the JAX backend: the same
+        growth model runs as a JIT-compiled lax.scan over the horizon
+        with crops as the batch dimension, returning the (N, T) biomass
+        trajectory without persisting anything. Intended for very large
+        ensembles where even the NumPy broadcast path is CPU-bound.
+
+        Requires the optional jax dependency; the regular CPU paths do
+        not import it.
+        """
+        if not _kernels.HAS_JAX:
+            raise ImportError(
+                "simulate_batch_jax requiere el paquete opcional 'jax'."
+            )
+
+        crops, crop_types, temperatures, rains, sun_hours, irrigations = (
+            self._prepare_batch(crop_ids, temperatures, rains, sun_hours, irrigations)
+        )
+
+        params = {
+            name: np.array(
+                [getattr(crop_type, name) for crop_type in crop_types],
+                dtype=np.float64,
+            )
+            for name in _kernels.ENSEMBLE_PARAM_NAMES
+        }
+        state = {
+            "biomass": np.array(
+                [
+                    crop.latest_biomass(crop_type.initial_biomass)
+                    for crop, crop_type in zip(crops, crop_types)
+                ]
+            ),
+            "water": np.array([crop.water_stored for crop in crops]),
+            "stress": np.array(
+                [crop.consecutive_stress_days for crop in crops], dtype=np.float64
+            ),
+            "days_done": np.array(
+                [len(crop.conditions) for crop in crops], dtype=np.float64
+            ),
+            "processing": np.array([crop.active for crop in crops]),
+        }
+        return np.asarray(
+            _kernels.simulate_ensemble_jax(
+                params, state, temperatures, rains, sun_hours, irrigations
+            )
+        )
+
+    def simulate_batch(
+        self,
+        crop_ids: list[str],
+        temperatures,
+        rains,
+        sun_hours,
+        irrigations=None,
+    ) -> list[Crop]:
+        """
+        Simulates the same horizon of days for many crops at once.
+
+        Per-crop-type parameters are stacked into length-N vectors and the
+        daily weather into (N, T) arrays, so every factor of the growth
+        model is evaluated for all crops in one broadcast expression;
+        only the time axis stays in a Python loop because each day's
+        biomass and water depend on the previous one. Intended for
+        admin/analytics bulk simulations; all crops are persisted with a
+        single storage call at the end.
+
+        Weather arrays may be one-dimensional (shared by every crop) or
+        already shaped (N, T) for per-crop series.
+        """
+        crops, crop_types, temperatures, rains, sun_hours, irrigations = (
+            self._prepare_batch(crop_ids, temperatures, rains, sun_hours, irrigations)
+        )
+        total_days = temperatures.shape[-1]
+
+        def param(name: str) -> np.ndarray:
+            return np.array(
+                [getattr(crop_type, name) for crop_type in crop_types],
+                dtype=np.float64,
+            )
+
+        # Per-crop-type parameters stacked into length-N vectors.
+        opt_temp = param("optimal_temp")
+        temp_sigma = param("temperature_curve_length")
+        min_temp = param("minimum_temp")
+        max_temp = param("maximum_temp")
+        stress_k = param("water_stress_constant")
+        water_low = param("water_opt_low")
+        water_high = param("water_opt_high")
+        water_capacity = param("water_capacity")
+        needed_light = param("needed_light")
+        needed_light_max = param("needed_light_max")
+        light_km = param("light_km")
+        light_sigma = param("light_sigma")
+        k_ini = param("phenological_initial_coefficient")
+        k_mid = param("phenological_mid_coefficient")
+        k_end = param("phenological_end_coefficient")
+        days_cycle = param("days_cycle")
+        p_max = param("photosyntesis_max_rate")
+        growth_coef = param("growth_breathing_coefficient")
+        base_rate = param("breathing_base_rate")
+        activation = param("activation_energy")
+        theta = param("theta")
+        potential = param("potential_performance")
+        stress_limit = param("consecutive_stress_days_limit")
+
+        opt_temp_kelvin = 273.15 + opt_temp
+        delta_temp = np.maximum(max_temp - min_temp, 0.1)
+        light_normalization = needed_light / (needed_light + light_km)
+        light_ceiling = np.exp(
+            -((needed_light_max - needed_light) ** 2) / (2 * light_sigma**2)
+        )
+
+        # Mutable per-crop state vectors.
+        biomass = np.array(
+            [
+                crop.latest_biomass(crop_type.initial_biomass)
+                for crop, crop_type in zip(crops, crop_types)
+            ]
+        )
+        water = np.array([crop.water_stored for crop in crops])
+        stress = np.array(
+            [crop.consecutive_stress_days for crop in crops], dtype=np.float64
+        )
+        days_done = np.array(
+            [len(crop.conditions) for crop in crops], dtype=np.float64
+        )
+        processing = np.array([crop.active for crop in crops], dtype=bool)
+        recorded: list[list[DailyCondition]] = [[] for _ in crops]
+
+        for t in range(total_days):
+            if not processing.any():
+                break
+
+            temp_t = temperatures[:, t]
+            rain_t = rains[:, t]
+            sun_t = sun_hours[:, t]
+            irrigation_t = irrigations[:, t]
+
+            # Environmental factors, broadcast over all N crops.
+            f_T = np.exp(-((temp_t - opt_temp) ** 2) / (2 * temp_sigma**2))
+            f_W = (1 / (1 + np.exp(stress_k * (water_low - water)))) * (
+                1 / (1 + np.exp(stress_k * (water - water_high)))
+            )
+            low_light = (sun_t / (sun_t + light_km)) / light_normalization
+            mid_light = np.exp(
+                -((sun_t - needed_light) ** 2) / (2 * light_sigma**2)
+            )
+            f_L = np.minimum(
+                np.where(
+                    sun_t <= needed_light,
+                    low_light,
+                    np.where(sun_t <= needed_light_max, mid_light, light_ceiling),
+                ),
+                1.0,
+            )
+
+            # Photosynthesis and respiration.
+            logistic_term = 1 - (biomass / potential) ** theta
+            photosynthesis = p_max * biomass * logistic_term * f_T * f_W * f_L
+            h_T = np.exp(
+                (activation / 8.314)
+                * ((1 / opt_temp_kelvin) - (1 / (273.15 + temp_t)))
+            )
+            respiration = growth_coef * photosynthesis + base_rate * biomass * h_T
+            new_biomass = np.maximum(0.0, biomass + photosynthesis - respiration)
+
+            # Water balance.
+            kc = crop_coefficient_phase(
+                (days_done + 1) / days_cycle, k_ini, k_mid, k_end
+            )
+            et0 = 0.0023 * (temp_t + 17.8) * np.sqrt(delta_temp)
+            et = kc * et0 * f_W
+            new_water = np.minimum(
+                water + rain_t + irrigation_t - et, water_capacity
+            )
+
+            # Stress / mortality bookkeeping, mirroring _check_mortality.
+            f_total = f_T * f_W * f_L
+            new_stress = np.where(f_total < 0.1, stress + 1, np.maximum(0, stress - 1))
+            died = processing & (
+                (new_stress >= stress_limit) | ((water <= 0) & (new_stress > 3))
+            )
+            harvested = processing & (new_biomass >= 0.95 * potential)
+            survivors = processing & ~died
+
+            biomass = np.where(survivors, new_biomass, biomass)
+            water = np.where(survivors, new_water, water)
+            stress = np.where(processing, new_stress, stress)
+            days_done = np.where(survivors, days_done + 1, days_done)
+
+            for i in np.flatnonzero(survivors):
+                recorded[i].append(
+                    DailyCondition(
+                        day=int(days_done[i]),
+                        temperature=float(temp_t[i]),
+                        rain=float(rain_t[i]),
+                        sun_hours=float(sun_t[i]),
+                        estimated_biomass=float(biomass[i]),
+                    )
+                )
+
+            completed = survivors & (days_done >= days_cycle)
+            processing = survivors & ~harvested & ~completed
+
+        # Write the accumulated state back into the crop objects and
+        # persist everything with a single bulk call.
+        for i, crop in enumerate(crops):
+            simulated = len(recorded[i])
+            crop.extend_conditions(recorded[i])
+            crop.water_stored = float(water[i])
+            crop.consecutive_stress_days = int(stress[i])
+            crop.last_sim_date += timedelta(days=simulated)
+            if crop.active:
+                crop.active = bool(processing[i])
+
+        self.storage.save_crops_bulk(crops)
+        return crops
+
     def get_crop_by_id(self, crop_id: str, requesting_user_id: str) -> Crop:
         """
         Retrieves a crop by its ID with permission validation.
         """
-        requesting_user = self.storage.get_user_by_id(requesting_user_id)
-        crop = self.storage.get_crop_by_id(crop_id)
+        crop, requesting_user, _ = self.storage.fetch_authorization_bundle(
+            crop_id, requesting_user_id
+        )
         if not requesting_user:
             raise UserNotFoundError(requesting_user_id)
         if not crop:
@@ -408,6 +1054,31 @@ class CropService:
 
         return crop
 
+    def _validate_weather_arrays(
+        self,
+        temperatures: np.ndarray,
+        rains: np.ndarray,
+        sun_hours: np.ndarray,
+        irrigations: np.ndarray,
+    ) -> None:
+        """
+        Validates whole weather arrays with one vectorized comparison per
+        bound, instead of six scalar checks per simulated day. The checks
+        are written as negated in-range tests so NaN fails them, exactly
+        like the chained comparison on the scalar path.
+        """
+
+        if not np.all((temperatures >= -10) & (temperatures < 56.7)):
+            raise InvalidInputError(
+                "La temperatura ingresada no es real (debe estar entre -10°C y 56.7°C)."
+            )
+        if not np.all(rains >= 0):
+            raise InvalidInputError("Valor de lluvia inválido (no puede ser negativo).")
+        if not np.all(irrigations >= 0):
+            raise InvalidInputError("Valor de riego inválido (no puede ser negativo).")
+        if not np.all((sun_hours >= 0) & (sun_hours <= 16)):
+            raise InvalidInputError("Las horas de sol deben estar entre 0 y 16.")
+
     def _validate_environmental_inputs(
         self, temperature: float, rain: float, sun_hours: float, irrigation: float = 0.0
     ):
@@ -424,7 +1095,7 @@ class CropService:
         if not isinstance(irrigation, (int, float)):
             raise InvalidInputError("El riego debe ser numérico.")
 
-        if temperature < -10 or temperature >= 56.7:
+        if not (-10 <= temperature < 56.7):
             raise InvalidInputError(
                 "La temperatura ingresada no es real (debe estar entre -10°C y 56.7°C)."
             )
@@ -455,11 +1126,20 @@ class CropService:
     def _get_crop_type(self, crop_type_id: str) -> CropType:
         """
         Retrieves and validates that the crop type exists.
+
+        Crop types are immutable during a crop's lifetime, so each one is
+        fetched from storage only once per service instance and then served
+        from a local cache (see invalidate_crop_type).
         """
 
+        crop_type = self._crop_type_cache.get(crop_type_id)
+        if crop_type is not None:
+            return crop_type
+
         crop_type = self.storage.get_crop_type_by_id(crop_type_id)
         if not crop_type:
             raise CropTypeNotFoundError(crop_type_id)
+        self._crop_type_cache[crop_type_id] = crop_type
         return crop_type
 
     def create_crop(
@@ -484,7 +1164,7 @@ class CropService:
         if not name or not name.strip():
             raise InvalidInputError("El nombre no es válido. ")
 
-        crop_unique_id = str(uuid.uuid4())
+        crop_unique_id = secrets.token_hex(16)
 
         # New object creation.
         new_crop = Crop(
@@ -509,8 +1189,9 @@ class CropService:
         """
         requesting_user = self.storage.get_user_by_id(requesting_user_id)
         crops = self.storage.get_crops_by_user(user_id)
-        owner = self.storage.get_user_by_id(user_id)
-        if not owner:
+        # When the requester is the owner, the fetch above already proves
+        # (or disproves) existence; otherwise a bare index probe suffices.
+        if requesting_user_id != user_id and not self.storage.user_exists(user_id):
             raise UserNotFoundError(user_id)
         if not requesting_user:
             raise UserNotFoundError(requesting_user_id)
@@ -527,8 +1208,9 @@ class CropService:
         """
         Method created to see the history of conditions of a crop.
         """
-        requesting_user = self.storage.get_user_by_id(requesting_user_id)
-        crop = self.storage.get_crop_by_id(crop_id)
+        crop, requesting_user, _ = self.storage.fetch_authorization_bundle(
+            crop_id, requesting_user_id
+        )
         if not requesting_user:
             raise UserNotFoundError(requesting_user_id)
         if not crop:
@@ -544,8 +1226,9 @@ class CropService:
         """
         Method created to update name or state of a crop.
         """
-        requesting_user = self.storage.get_user_by_id(requesting_user_id)
-        crop = self.storage.get_crop_by_id(crop_id)
+        crop, requesting_user, _ = self.storage.fetch_authorization_bundle(
+            crop_id, requesting_user_id
+        )
         if not requesting_user:
             raise UserNotFoundError(requesting_user_id)
         if not crop:
@@ -556,18 +1239,20 @@ class CropService:
         ):
             raise ResourceOwnershipError("No puedes acceder a estos cultivos.")
 
-        # Are the arguments in the changes - allowed fields ?
-        allowed_fields = ["name", "active"]
+        # Validate and apply in a single pass over the allowed-field set;
+        # the storage write only happens when something actually changed.
+        changed = False
         for key, value in kwargs.items():
-            if key not in allowed_fields:
+            if key not in _CROP_UPDATABLE_FIELDS:
                 raise InvalidInputError(
                     "El atributo ingresado NO existe, o no puede ser cambiado."
                 )
+            if getattr(crop, key) != value:
+                setattr(crop, key, value)
+                changed = True
 
-        for key, value in kwargs.items():
-            setattr(crop, key, value)
-
-        self.storage.save_crop(crop)
+        if changed:
+            self.storage.save_crop(crop)
         return crop
 
     def delete_crop(self, crop_id: str, requesting_user_id: str) -> None:
@@ -575,13 +1260,13 @@ class CropService:
         Method created to delete a crop.
         """
         # Validations
-        requesting_user = self.storage.get_user_by_id(requesting_user_id)
-        crop = self.storage.get_crop_by_id(crop_id)
+        crop, requesting_user, owner = self.storage.fetch_authorization_bundle(
+            crop_id, requesting_user_id
+        )
         if not requesting_user:
             raise UserNotFoundError(requesting_user_id)
         if not crop:
             raise CropNotFoundError(crop_id)
-        owner = self.storage.get_user_by_id(crop.user_id)
         if not owner:
             raise UserNotFoundError(crop.user_id)
         if (
@@ -602,35 +1287,24 @@ class CropService:
         Generates statistics for a crop based on its growth history.
         """
 
-        self._validate_user_exists(requesting_user_id)
-
-        crop = self._get_and_validate_crop_access(crop_id, requesting_user_id)
-        crop_type = self._get_crop_type(crop.crop_type_id)
-
-        return self._calculate_statistics(crop, crop_type)
-
-    def _validate_user_exists(self, user_id: str):
-        """
-        Validates that the requesting user exists.
-        """
-
-        user = self.storage.get_user_by_id(user_id)
-        if not user:
-            raise UserNotFoundError(user_id)
-
-    def _get_and_validate_crop_access(self, crop_id: str, user_id: str) -> Crop:
-        """
-        Retrieves crop and validates that the user has access to it.
-        """
-        crop = self.storage.get_crop_by_id(crop_id)
+        # Authorization first (one bundle fetch, pure attribute checks);
+        # the crop type is only fetched once access is granted.
+        crop, requesting_user, _ = self.storage.fetch_authorization_bundle(
+            crop_id, requesting_user_id
+        )
+        if not requesting_user:
+            raise UserNotFoundError(requesting_user_id)
         if not crop:
             raise CropNotFoundError(crop_id)
-
-        user = self.storage.get_user_by_id(user_id)
-        if user_id != crop.user_id and user.role.value != UserRole.ADMIN.value:
+        if (
+            requesting_user_id != crop.user_id
+            and requesting_user.role.value != UserRole.ADMIN.value
+        ):
             raise ResourceOwnershipError("No puedes acceder a este cultivo.")
 
-        return crop
+        crop_type = self._get_crop_type(crop.crop_type_id)
+
+        return self._calculate_statistics(crop, crop_type)
 
     def _calculate_statistics(self, crop: Crop, crop_type: CropType) -> dict:
         """
@@ -640,9 +1314,12 @@ class CropService:
         if not crop.conditions:
             return self._empty_statistics()
 
-        averages = self._calculate_averages(crop.conditions)
+        # One contiguous array per channel; every aggregate below is a
+        # single compiled NumPy pass instead of a Python loop per metric.
+        arrays = crop.condition_arrays()
+        averages = self._calculate_averages(arrays)
         growth_stats = self._calculate_growth_stats(crop.conditions, crop_type)
-        stress_days = self._calculate_stress_days(crop.conditions, crop_type)
+        stress_days = self._calculate_stress_days(arrays["temperature"], crop_type)
         performance = self._calculate_performance(crop.conditions, crop_type)
 
         return {
@@ -668,12 +1345,12 @@ class CropService:
             "performance_ratio": 0,
         }
 
-    def _calculate_averages(self, conditions: list) -> dict:
+    def _calculate_averages(self, arrays: dict[str, np.ndarray]) -> dict:
         """Calculates average temperature, rain, and sun hours."""
         return {
-            "temp": sum(c.temperature for c in conditions) / len(conditions),
-            "rain": sum(c.rain for c in conditions) / len(conditions),
-            "sun": sum(c.sun_hours for c in conditions) / len(conditions),
+            "temp": float(arrays["temperature"].mean()),
+            "rain": float(arrays["rain"].mean()),
+            "sun": float(arrays["sun_hours"].mean()),
         }
 
     def _calculate_growth_stats(self, conditions: list, crop_type: CropType) -> dict:
@@ -682,18 +1359,18 @@ class CropService:
         final = conditions[-1].estimated_biomass
         return {"total": final - initial}
 
-    def _calculate_stress_days(self, conditions: list, crop_type: CropType) -> int:
+    def _calculate_stress_days(
+        self, temperatures: np.ndarray, crop_type: CropType
+    ) -> int:
         """Counts days where temperature was outside optimal range."""
         lower = crop_type.minimum_temp
         upper = crop_type.maximum_temp
-        return sum(
-            1 for c in conditions if c.temperature < lower or c.temperature > upper
-        )
+        return int(np.count_nonzero((temperatures < lower) | (temperatures > upper)))
 
     def _calculate_performance(self, conditions: list, crop_type: CropType) -> float:
         """Calculates performance ratio (final / potential)."""
         final = conditions[-1].estimated_biomass
-        return final / crop_type.potential_performance
+        return final * crop_type.inv_potential_performance
 
 
 class UserService:
@@ -722,14 +1399,12 @@ class UserService:
         if searched_user:
             raise UserAlreadyExistsError(searched_user.id)
 
-        user_unique_id = str(uuid.uuid4())
-        # Password Hash
-        hashed_pwd = bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode(
-            "utf-8"
-        )
+        user_unique_id = secrets.token_hex(16)
 
         # New user creation
-        new_user = User(user_unique_id, username, hashed_pwd, UserRole.USER, [])
+        new_user = User(
+            user_unique_id, username, _hash_password(password), UserRole.USER, []
+        )
 
         self.storage.save_user(new_user)
         return new_user
@@ -782,10 +1457,8 @@ class UserService:
         Checks that no admin user already exists in the system.
         """
 
-        users = self.storage.get_users()
-        for user in users:
-            if user.role.value == UserRole.ADMIN.value:
-                raise AdminAlreadyExistsError()
+        if self.storage.admin_exists():
+            raise AdminAlreadyExistsError()
 
     def _ensure_username_unique(self, username: str):
         """
@@ -800,12 +1473,8 @@ class UserService:
         Creates a new admin user with hashed password.
         """
 
-        user_id = str(uuid.uuid4())
-        hashed = bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode(
-            "utf-8"
-        )
-
-        return User(user_id, username, hashed, UserRole.ADMIN, [])
+        user_id = secrets.token_hex(16)
+        return User(user_id, username, _hash_password(password), UserRole.ADMIN, [])
 
     def login(self, username: str, password: str) -> User:
         """
@@ -819,10 +1488,8 @@ class UserService:
         if not user:
             raise UserNotFoundError(username)
 
-        entered_password = password.encode("utf-8")
-        stored_hash = user.password_hash.encode("utf-8")
-        # Checkpw compares two of the passwords
-        if not bcrypt.checkpw(entered_password, stored_hash):
+        # Recently verified credentials skip the bcrypt KDF entirely.
+        if not _verify_password(password, user.password_hash):
             raise AuthorizationError("La contraseña o el usuario es incorrecto.")
 
         return user
@@ -848,8 +1515,10 @@ class UserService:
         ) and requesting_user.role.value != UserRole.ADMIN.value:
             raise ResourceOwnershipError("No puedes acceder a esta información.")
 
-        crop_ids = self.storage.get_crops_by_user(user.id)
-        user.crop_ids = crop_ids
+        # Store the ids (the model contract for crop_ids); assigning the
+        # Crop objects themselves would poison the storage-level user
+        # memo and break the next save_user serialization.
+        user.crop_ids = [crop.id for crop in self.storage.get_crops_by_user(user.id)]
         return user
 
     def get_user_by_username(self, username: str, requesting_user_id: str):
@@ -873,8 +1542,9 @@ class UserService:
         ) and requesting_user.role.value != UserRole.ADMIN.value:
             raise ResourceOwnershipError("No puedes acceder a esta información.")
 
-        crop_ids = self.storage.get_crops_by_user(requesting_user_id)
-        user.crop_ids = crop_ids
+        # Ids of the looked-up user's crops (not the requester's, which
+        # this method mistakenly listed before).
+        user.crop_ids = [crop.id for crop in self.storage.get_crops_by_user(user.id)]
         return user
 
     def get_all_users(self, requesting_user_id: str) -> list[User]:
@@ -915,17 +1585,17 @@ class UserService:
         if not user:
             raise UserNotFoundError(user_id)
 
-        first_entered_password = old_password.encode("utf-8")
-        stored_hash = user.password_hash.encode("utf-8")
-
-        if not bcrypt.checkpw(first_entered_password, stored_hash):
+        if not _verify_password(old_password, user.password_hash):
             raise AuthorizationError("La contraseña es incorrecta.")
-        new_hashed_password = bcrypt.hashpw(
-            new_password.encode("utf-8"), bcrypt.gensalt()
-        ).decode("utf-8")
-        if not (user.password_hash == new_hashed_password):
-            user.password_hash = new_hashed_password
 
+        # Same password as before: nothing to change, and no reason to
+        # pay another KDF for a fresh salt. (Comparing a newly produced
+        # hash against the stored one can never match - the salt is
+        # random - so that is not a usable check.)
+        if _verify_password(new_password, user.password_hash):
+            return
+
+        user.password_hash = _hash_password(new_password)
         self.storage.save_user(user)
 
     def update_username(
@@ -1060,9 +1730,25 @@ class CropTypeService:
     of crop types.
     """
 
-    def __init__(self, storage: Database, user_service: UserService):
+    def __init__(
+        self,
+        storage: Database,
+        user_service: UserService,
+        crop_service: CropService | None = None,
+    ):
         self.storage: Database = storage
         self.user_service: UserService = user_service
+        # When wired, admin mutations notify the simulation service so
+        # its crop-type cache never serves edited or deleted types.
+        self.crop_service: CropService | None = crop_service
+
+    def _notify_crop_type_changed(self, crop_type_id: str) -> None:
+        """
+        Drops the mutated crop type from the CropService cache, if one
+        is wired to this service.
+        """
+        if self.crop_service is not None:
+            self.crop_service.invalidate_crop_type(crop_type_id)
 
     def _validate_admin(self, admin_id: str):
         """
@@ -1189,7 +1875,7 @@ class CropTypeService:
         """Creates a new CropType instance."""
 
         return CropType(
-            id=str(uuid.uuid4()),
+            id=secrets.token_hex(16),
             name=name,
             optimal_temp=optimal_temp,
             minimum_temp=minimum_temp,
@@ -1371,7 +2057,11 @@ class CropTypeService:
         validated_kwargs = self._validate_and_filter_update_fields(kwargs)
         self._apply_updates(crop_type, validated_kwargs)
 
+        # The derived reciprocals depend on the updated fields.
+        crop_type._compute_derived()
+
         self.storage.save_crop_type(crop_type)
+        self._notify_crop_type_changed(crop_type_id)
         return crop_type
 
     def _validate_admin_access(self, admin_id: str):
@@ -1418,7 +2108,7 @@ class CropTypeService:
         """Validates that a numeric field is positive."""
         try:
             num_value = float(value)
-        except TypeError, ValueError:
+        except (TypeError, ValueError):
             raise InvalidInputError(f"El valor para '{key}' debe ser numérico.")
 
         if num_value <= 0:
@@ -1429,7 +2119,7 @@ class CropTypeService:
         """Validates that an integer field is positive."""
         try:
             int_value = int(value)
-        except TypeError, ValueError:
+        except (TypeError, ValueError):
             raise InvalidInputError(f"El valor para '{key}' debe ser un número entero.")
 
         if int_value <= 0:
@@ -1509,6 +2199,7 @@ class CropTypeService:
         self._validate_no_active_crops_using(crop_type)
 
         self.storage.delete_crop_type(crop_type_to_eliminate_id)
+        self._notify_crop_type_changed(crop_type_to_eliminate_id)
 
     def _get_crop_type(self, crop_type_id: str) -> CropType:
         """Retrieves and validates that the crop type exists."""
@@ -1572,7 +2263,7 @@ class CropTypeService:
 
         try:
             num_value = float(value)
-        except TypeError, ValueError:
+        except (TypeError, ValueError):
             raise InvalidInputError(f"El valor para '{key}' debe ser numérico.")
         if num_value < -7:
             raise InvalidInputError(f"El valor para '{key}' no puede ser menor a -7°C.")
@@ -0,0 +1,459 @@
+import json
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+
+from .models import User, Crop, CropType, UserRole, DailyCondition
+from .storage import AuthorizationBundle, _ROLE_DECODER, _crop_type_to_row
+
+
+class SQLiteStorage:
+    """
+    SQLiteStorage class implementing the Database protocol on an
+    embedded SQLite file: every lookup that JSONStorage answers with an
+    in-memory index becomes an indexed query here, mutations touch only
+    the affected rows instead of rewriting the whole database, and WAL
+    mode keeps concurrent readers cheap. It preserves the single-file
+    simplicity of the JSON backend while scaling past it.
+    """
+
+    def __init__(self, filepath: str | Path = "data/database.sqlite") -> None:
+        """
+        __init__ method that opens (or creates) the SQLite file and
+        prepares the schema and its indexes.
+        """
+        self.filepath: Path = Path(filepath)
+        self._connection = sqlite3.connect(self.filepath)
+        self._connection.row_factory = sqlite3.Row
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._create_schema()
+
+    def _create_schema(self) -> None:
+        """
+        Creates the tables and the indexes backing the hot queries:
+        crops by user, crops by type and the partial index over active
+        crops.
+        """
+        with self._connection:
+            self._connection.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS users (
+                    id TEXT PRIMARY KEY,
+                    username TEXT UNIQUE NOT NULL,
+                    password_hash TEXT NOT NULL,
+                    role TEXT NOT NULL,
+                    crop_ids TEXT NOT NULL DEFAULT '[]'
+                );
+                CREATE TABLE IF NOT EXISTS crops (
+                    id TEXT PRIMARY KEY,
+                    name TEXT NOT NULL,
+                    user_id TEXT NOT NULL,
+                    crop_type_id TEXT NOT NULL,
+                    start_date TEXT NOT NULL,
+                    water_stored REAL NOT NULL,
+                    last_sim_date TEXT NOT NULL,
+                    consecutive_stress_days INTEGER NOT NULL,
+                    current_phase TEXT NOT NULL,
+                    active INTEGER NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS crop_conditions (
+                    crop_id TEXT NOT NULL,
+                    day INTEGER NOT NULL,
+                    temperature REAL NOT NULL,
+                    rain REAL NOT NULL,
+                    sun_hours REAL NOT NULL,
+                    estimated_biomass REAL NOT NULL,
+                    PRIMARY KEY (crop_id, day)
+                );
+                CREATE TABLE IF NOT EXISTS crop_types (
+                    id TEXT PRIMARY KEY,
+                    name TEXT UNIQUE NOT NULL COLLATE NOCASE,
+                    data TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_crops_user
+                    ON crops (user_id);
+                CREATE INDEX IF NOT EXISTS idx_crops_type
+                    ON crops (crop_type_id);
+                CREATE INDEX IF NOT EXISTS idx_crops_active
+                    ON crops (id) WHERE active = 1;
+                CREATE INDEX IF NOT EXISTS idx_users_role
+                    ON users (role);
+                """
+            )
+
+    def read(self) -> dict[str, list]:
+        """
+        Method not implemented in SQLite; the whole-file read/save pair
+        only makes sense for the JSON backend.
+        """
+        raise NotImplementedError("Método de lectura no implementado para SQLite.")
+
+    def save(self, data: dict[str, list]) -> None:
+        """
+        Method not implemented in SQLite; mutations go through the
+        row-level save_* methods.
+        """
+        raise NotImplementedError("Método de guardado no implementado para SQLite.")
+
+    # ------------------------------------------------------------------
+    # Users
+
+    def _row_to_user(self, row: sqlite3.Row) -> User:
+        return User(
+            id=row["id"],
+            username=row["username"],
+            password_hash=row["password_hash"],
+            role=_ROLE_DECODER[row["role"]],
+            crop_ids=json.loads(row["crop_ids"]),
+        )
+
+    def get_users(self) -> list[User]:
+        """
+        Get users method to read all the users registered in DB.
+        """
+        rows = self._connection.execute("SELECT * FROM users").fetchall()
+        return [self._row_to_user(row) for row in rows]
+
+    def get_user_by_id(self, user_id: str) -> User | None:
+        """
+        Get user by id method resolved through the primary key.
+        """
+        row = self._connection.execute(
+            "SELECT * FROM users WHERE id = ?", (user_id,)
+        ).fetchone()
+        return self._row_to_user(row) if row else None
+
+    def get_user_by_username(self, username: str) -> User | None:
+        """
+        Get user by username method resolved through the unique index.
+        """
+        row = self._connection.execute(
+            "SELECT * FROM users WHERE username = ?", (username,)
+        ).fetchone()
+        return self._row_to_user(row) if row else None
+
+    def get_users_by_role(self, role: UserRole) -> list[User]:
+        """
+        Get users by role method backed by the role index.
+        """
+        rows = self._connection.execute(
+            "SELECT * FROM users WHERE role = ?", (role.value,)
+        ).fetchall()
+        return [self._row_to_user(row) for row in rows]
+
+    def admin_exists(self) -> bool:
+        """
+        Admin exists method answered with an indexed EXISTS query.
+        """
+        row = self._connection.execute(
+            "SELECT 1 FROM users WHERE role = ? LIMIT 1", (UserRole.ADMIN.value,)
+        ).fetchone()
+        return row is not None
+
+    def user_exists(self, user_id: str) -> bool:
+        """
+        User exists method: a primary-key probe, no object materialized.
+        """
+        row = self._connection.execute(
+            "SELECT 1 FROM users WHERE id = ?", (user_id,)
+        ).fetchone()
+        return row is not None
+
+    def save_user(self, user: User) -> None:
+        """
+        Save user method; an upsert on the primary key.
+        """
+        with self._connection:
+            self._connection.execute(
+                """
+                INSERT INTO users (id, username, password_hash, role, crop_ids)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(id) DO UPDATE SET
+                    username = excluded.username,
+                    password_hash = excluded.password_hash,
+                    role = excluded.role,
+                    crop_ids = excluded.crop_ids
+                """,
+                (
+                    user.id,
+                    user.username,
+                    user.password_hash,
+                    user.role.value,
+                    json.dumps(user.crop_ids),
+                ),
+            )
+
+    def delete_user(self, user_id: str) -> None:
+        """
+        Delete user method; touches one row.
+        """
+        with self._connection:
+            self._connection.execute("DELETE FROM users WHERE id = ?", (user_id,))
+
+    # ------------------------------------------------------------------
+    # Crops
+
+    def _row_to_crop(self, row: sqlite3.Row) -> Crop:
+        conditions = [
+            DailyCondition(
+                day=c["day"],
+                temperature=c["temperature"],
+                rain=c["rain"],
+                sun_hours=c["sun_hours"],
+                estimated_biomass=c["estimated_biomass"],
+            )
+            for c in self._connection.execute(
+                "SELECT * FROM crop_conditions WHERE crop_id = ? ORDER BY day",
+                (row["id"],),
+            )
+        ]
+        return Crop(
+            id=row["id"],
+            name=row["name"],
+            user_id=row["user_id"],
+            crop_type_id=row["crop_type_id"],
+            start_date=datetime.fromisoformat(row["start_date"]),
+            water_stored=row["water_stored"],
+            last_sim_date=datetime.fromisoformat(row["last_sim_date"]),
+            conditions=conditions,
+            consecutive_stress_days=row["consecutive_stress_days"],
+            current_phase=row["current_phase"],
+            active=bool(row["active"]),
+        )
+
+    def get_crops(self) -> list[Crop]:
+        """
+        Get crops method, used to get all crops registered in DB.
+        """
+        rows = self._connection.execute("SELECT * FROM crops").fetchall()
+        return [self._row_to_crop(row) for row in rows]
+
+    def get_crop_by_id(self, crop_id: str) -> Crop | None:
+        """
+        Get crop by id method resolved through the primary key.
+        """
+        row = self._connection.execute(
+            "SELECT * FROM crops WHERE id = ?", (crop_id,)
+        ).fetchone()
+        return self._row_to_crop(row) if row else None
+
+    def get_crop_and_type(
+        self, crop_id: str
+    ) -> tuple[Crop | None, CropType | None]:
+        """
+        Get crop and type method created to fetch a crop together with
+        its crop type in one storage call from the service layer.
+        """
+        crop = self.get_crop_by_id(crop_id)
+        if not crop:
+            return None, None
+        return crop, self.get_crop_type_by_id(crop.crop_type_id)
+
+    def fetch_authorization_bundle(
+        self, crop_id: str, requesting_user_id: str
+    ) -> AuthorizationBundle:
+        """
+        Fetch authorization bundle method mirroring the JSON backend:
+        crop, requesting user and owner in one call, reusing the
+        requester lookup when they own the crop.
+        """
+        crop = self.get_crop_by_id(crop_id)
+        requesting_user = self.get_user_by_id(requesting_user_id)
+
+        if crop is None:
+            owner = None
+        elif crop.user_id == requesting_user_id:
+            owner = requesting_user
+        else:
+            owner = self.get_user_by_id(crop.user_id)
+
+        return AuthorizationBundle(crop, requesting_user, owner)
+
+    def get_crops_by_user(self, user_id: str) -> list[Crop]:
+        """
+        Get crops by user method backed by the user_id index.
+        """
+        rows = self._connection.execute(
+            "SELECT * FROM crops WHERE user_id = ?", (user_id,)
+        ).fetchall()
+        return [self._row_to_crop(row) for row in rows]
+
+    def get_crops_by_type(self, crop_type_id: str) -> list[Crop]:
+        """
+        Get crops by type method backed by the crop_type_id index.
+        """
+        rows = self._connection.execute(
+            "SELECT * FROM crops WHERE crop_type_id = ?", (crop_type_id,)
+        ).fetchall()
+        return [self._row_to_crop(row) for row in rows]
+
+    def get_active_crops(self) -> list[Crop]:
+        """
+        Get active crops method backed by the partial active index.
+        """
+        rows = self._connection.execute(
+            "SELECT * FROM crops WHERE active = 1"
+        ).fetchall()
+        return [self._row_to_crop(row) for row in rows]
+
+    def _upsert_crop(self, crop: Crop) -> None:
+        self._connection.execute(
+            """
+            INSERT INTO crops (id, name, user_id, crop_type_id, start_date,
+                               water_stored, last_sim_date,
+                               consecutive_stress_days, current_phase, active)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(id) DO UPDATE SET
+                name = excluded.name,
+                user_id = excluded.user_id,
+                crop_type_id = excluded.crop_type_id,
+                start_date = excluded.start_date,
+                water_stored = excluded.water_stored,
+                last_sim_date = excluded.last_sim_date,
+                consecutive_stress_days = excluded.consecutive_stress_days,
+                current_phase = excluded.current_phase,
+                active = excluded.active
+            """,
+            (
+                crop.id,
+                crop.name,
+                crop.user_id,
+                crop.crop_type_id,
+                crop.start_date.isoformat(),
+                crop.water_stored,
+                crop.last_sim_date.isoformat(),
+                crop.consecutive_stress_days,
+                crop.current_phase,
+                int(crop.active),
+            ),
+        )
+        self._connection.executemany(
+            """
+            INSERT OR REPLACE INTO crop_conditions
+                (crop_id, day, temperature, rain, sun_hours, estimated_biomass)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            [
+                (
+                    crop.id,
+                    c.day,
+                    c.temperature,
+                    c.rain,
+                    c.sun_hours,
+                    c.estimated_biomass,
+                )
+                for c in crop.conditions
+            ],
+        )
+
+    def save_crop(self, crop: Crop) -> None:
+        """
+        Save crop method; upserts the crop row and its conditions.
+        """
+        with self._connection:
+            self._upsert_crop(crop)
+
+    def save_crops_bulk(self, crops: list[Crop]) -> None:
+        """
+        Save crops bulk method; all upserts commit in one transaction.
+        """
+        with self._connection:
+            for crop in crops:
+                self._upsert_crop(crop)
+
+    def save_daily_condition(self, crop_id: str, condition: DailyCondition) -> None:
+        """
+        Save daily condition method; one row per simulated day.
+        """
+        with self._connection:
+            self._connection.execute(
+                """
+                INSERT OR REPLACE INTO crop_conditions
+                    (crop_id, day, temperature, rain, sun_hours, estimated_biomass)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    crop_id,
+                    condition.day,
+                    condition.temperature,
+                    condition.rain,
+                    condition.sun_hours,
+                    condition.estimated_biomass,
+                ),
+            )
+
+    def delete_crop(self, crop_id: str) -> None:
+        """
+        Delete crop method; removes the crop and its conditions.
+        """
+        with self._connection:
+            self._connection.execute("DELETE FROM crops WHERE id = ?", (crop_id,))
+            self._connection.execute(
+                "DELETE FROM crop_conditions WHERE crop_id = ?", (crop_id,)
+            )
+
+    # ------------------------------------------------------------------
+    # Crop types
+
+    def get_crop_types(self) -> list[CropType]:
+        """
+        Get crop types method to see all the crop types available.
+        """
+        rows = self._connection.execute("SELECT data FROM crop_types").fetchall()
+        return [CropType(**json.loads(row["data"])) for row in rows]
+
+    def get_crop_type_by_id(self, crop_type_id: str) -> CropType | None:
+        """
+        Get crop type by id method resolved through the primary key.
+        """
+        row = self._connection.execute(
+            "SELECT data FROM crop_types WHERE id = ?", (crop_type_id,)
+        ).fetchone()
+        return CropType(**json.loads(row["data"])) if row else None
+
+    def get_crop_type_by_name(self, name: str) -> CropType | None:
+        """
+        Get crop type by name method; the NOCASE collation keeps the
+        case-insensitive contract of the JSON backend.
+        """
+        row = self._connection.execute(
+            "SELECT data FROM crop_types WHERE name = ?", (name,)
+        ).fetchone()
+        return CropType(**json.loads(row["data"])) if row else None
+
+    def save_crop_type(self, crop_type: CropType) -> None:
+        """
+        Save crop type method; the full record rides in a JSON column,
+        with id and name as indexed keys.
+        """
+        with self._connection:
+            self._connection.execute(
+                """
+                INSERT INTO crop_types (id, name, data) VALUES (?, ?, ?)
+                ON CONFLICT(id) DO UPDATE SET
+                    name = excluded.name,
+                    data = excluded.data
+                """,
+                (
+                    crop_type.id,
+                    crop_type.name,
+                    json.dumps(_crop_type_to_row(crop_type)),
+                ),
+            )
+
+    def delete_crop_type(self, crop_type_id: str) -> None:
+        """
+        Delete crop type method.
+        """
+        with self._connection:
+            self._connection.execute(
+                "DELETE FROM crop_types WHERE id = ?", (crop_type_id,)
+            )
+
+    def clear_all_data(self) -> None:
+        """
+        Clear all data method implemented to empty every table.
+        """
+        with self._connection:
+            for table in ("users", "crops", "crop_conditions", "crop_types"):
+                self._connection.execute(f"DELETE FROM {table}")
@@ -4,6 +4,7 @@ from dotenv import load_dotenv
 from supabase import create_client, Client
 
 from .models import User, UserRole, Crop, CropType, DailyCondition
+from .storage import AuthorizationBundle
 
 load_dotenv()
 
@@ -100,6 +101,52 @@ class SupabaseStorage:
             crop_ids=[],
         )
 
+    def get_users_by_role(self, role: UserRole) -> list[User]:
+        """
+        Method get_users_by_role() created for bulk admin queries: the
+        role filter runs in the database, so only matching rows travel.
+        """
+
+        response = (
+            self.client.table("users").select("*").eq("role", role.value).execute()
+        )
+        return [
+            User(
+                id=row["id"],
+                username=row["username"],
+                password_hash=row["password_hash"],
+                role=UserRole(row["role"]),
+                crop_ids=[],
+            )
+            for row in response.data
+        ]
+
+    def user_exists(self, user_id: str) -> bool:
+        """
+        Method user_exists() created for pure existence checks: one
+        indexed probe, no User object (or its crops) materialized.
+        """
+
+        response = (
+            self.client.table("users").select("id").eq("id", user_id).limit(1).execute()
+        )
+        return bool(response.data)
+
+    def admin_exists(self) -> bool:
+        """
+        Method admin_exists() created to answer the one-admin rule with
+        a single indexed probe instead of loading every user.
+        """
+
+        response = (
+            self.client.table("users")
+            .select("id")
+            .eq("role", UserRole.ADMIN.value)
+            .limit(1)
+            .execute()
+        )
+        return bool(response.data)
+
     def save_user(self, user: User) -> None:
         """
         Method save_user() created to save an user's data in the DataBase using PostgreSQL
@@ -421,6 +468,43 @@ class SupabaseStorage:
         )
         return crop
 
+    def get_crop_and_type(
+        self, crop_id: str
+    ) -> tuple[Crop | None, CropType | None]:
+        """
+        Method get_crop_and_type() created to fetch a crop together with
+        its crop type in one storage call from the service layer, as the
+        other backends do.
+        """
+
+        crop = self.get_crop_by_id(crop_id)
+        if not crop:
+            return None, None
+        return crop, self.get_crop_type_by_id(crop.crop_type_id)
+
+    def fetch_authorization_bundle(
+        self, crop_id: str, requesting_user_id: str
+    ) -> AuthorizationBundle:
+        """
+        Method fetch_authorization_bundle() created to resolve a crop,
+        the requesting user and the crop's owner together for the
+        service-layer authorization checks; when the requester owns the
+        crop the owner lookup is reused instead of repeated, mirroring
+        the JSON and SQLite backends.
+        """
+
+        crop = self.get_crop_by_id(crop_id)
+        requesting_user = self.get_user_by_id(requesting_user_id)
+
+        if crop is None:
+            owner = None
+        elif crop.user_id == requesting_user_id:
+            owner = requesting_user
+        else:
+            owner = self.get_user_by_id(crop.user_id)
+
+        return AuthorizationBundle(crop, requesting_user, owner)
+
     def get_crops_by_user(self, user_id: str) -> list[Crop]:
         """
         Method get_crop_by_user() created to get the data of a Crop by its
@@ -589,6 +673,32 @@ class SupabaseStorage:
 
         self.client.table("crops").upsert(data).execute()
 
+    def save_crops_bulk(self, crops: list[Crop]) -> None:
+        """
+        Method save_crops_bulk() created to upsert many crops with a
+        single request instead of one round-trip per crop; used by the
+        batched simulation paths.
+        """
+
+        if not crops:
+            return
+        rows = [
+            {
+                "id": crop.id,
+                "name": crop.name,
+                "user_id": crop.user_id,
+                "crop_type_id": crop.crop_type_id,
+                "start_date": crop.start_date.isoformat(),
+                "last_sim_date": crop.last_sim_date.isoformat(),
+                "active": crop.active,
+                "consecutive_stress_days": crop.consecutive_stress_days,
+                "current_phase": crop.current_phase,
+                "water_stored": crop.water_stored,
+            }
+            for crop in crops
+        ]
+        self.client.table("crops").upsert(rows).execute()
+
     def delete_crop(self, crop_id: str) -> None:
         """
         Method delete_crop() created to delete a crop from the DB.
@@ -2,6 +2,7 @@ import pytest
 from unittest.mock import Mock
 from src.cultiva_lab.services import CropService, UserService, CropTypeService
 from src.cultiva_lab.models import User, UserRole, Crop, CropType, DailyCondition
+from src.cultiva_lab.storage import AuthorizationBundle
 from src.cultiva_lab.exceptions import (
     UserNotFoundError,
     UserAlreadyExistsError,
@@ -13,7 +14,7 @@ from src.cultiva_lab.exceptions import (
     DuplicateDataError,
     BusinessRuleViolationError,
 )
-from datetime import datetime
+from datetime import datetime, timedelta
 import bcrypt
 
 """
@@ -236,6 +237,7 @@ def test_simulate_day_success():
 
     storage.get_crop_by_id.return_value = crop
     storage.get_crop_type_by_id.return_value = banana_crop_type
+    storage.get_crop_and_type.return_value = (crop, banana_crop_type)
     storage.get_user_by_id.return_value = user
 
     service = CropService(storage)
@@ -283,6 +285,7 @@ def test_simulate_day_crop_inactive_fails():
     )
     storage.get_crop_by_id.return_value = crop
     storage.get_crop_type_by_id.return_value = banana_crop_type
+    storage.get_crop_and_type.return_value = (crop, banana_crop_type)
 
     service = CropService(storage)
     with pytest.raises(InvalidInputError):
@@ -326,6 +329,7 @@ def test_simulate_day_wrong_owner_fails():
     )
     storage.get_crop_by_id.return_value = crop
     storage.get_crop_type_by_id.return_value = banana_crop_type
+    storage.get_crop_and_type.return_value = (crop, banana_crop_type)
     storage.get_user_by_id.return_value = intruder
 
     service = CropService(storage)
@@ -333,6 +337,174 @@ def test_simulate_day_wrong_owner_fails():
         service.simulate_day("456", "999", 27, 100, 12)
 
 
+"""
+Simulate several days in one batched call and verify the trajectory.
+"""
+
+
+def test_simulate_days_success():
+    storage = Mock()
+    user = User("123", "nikoloko", "hashed_pwd", UserRole.USER, [])
+
+    banana_crop_type = create_valid_crop_type(
+        id="123",
+        name="Cultivo de Bananas",
+        optimal_temp=27.0,
+        minimum_temp=22.0,
+        maximum_temp=32.0,
+        needed_water=100.0,
+        needed_light=12.0,
+        days_cycle=360,
+        activation_energy=50000,
+        initial_biomass=0.75,
+        potential_performance=50.0,
+    )
+
+    start_date = datetime.now()
+    crop = Crop(
+        id="456",
+        name="Cultivo de Bananas",
+        user_id="123",
+        crop_type_id="123",
+        water_stored=75.0,
+        start_date=start_date,
+        last_sim_date=start_date,
+        conditions=[],
+        active=True,
+        consecutive_stress_days=0,
+        current_phase="Fase Inicial",
+    )
+
+    storage.get_crop_by_id.return_value = crop
+    storage.get_crop_type_by_id.return_value = banana_crop_type
+    storage.get_crop_and_type.return_value = (crop, banana_crop_type)
+    storage.get_user_by_id.return_value = user
+
+    service = CropService(storage)
+    updated_crop = service.simulate_days(
+        "456", "123", [27, 26, 28], [100, 90, 95], [12, 11, 12]
+    )
+
+    assert updated_crop is not None
+    assert len(updated_crop.conditions) == 3
+    assert updated_crop.conditions[0].day == 1
+    assert updated_crop.conditions[2].day == 3
+    assert updated_crop.last_sim_date == start_date + timedelta(days=3)
+    storage.save_crop.assert_called_once()
+
+
+"""
+Batch-simulate two crops with a shared weather horizon.
+"""
+
+
+def test_simulate_batch_success():
+    storage = Mock()
+    banana_crop_type = create_valid_crop_type(
+        id="123",
+        name="Cultivo de Bananas",
+        optimal_temp=27.0,
+        minimum_temp=22.0,
+        maximum_temp=32.0,
+        needed_water=100.0,
+        needed_light=12.0,
+        days_cycle=360,
+        activation_energy=50000,
+        initial_biomass=0.75,
+        potential_performance=50.0,
+    )
+    start_date = datetime.now()
+
+    def make_crop(crop_id: str) -> Crop:
+        return Crop(
+            id=crop_id,
+            name=f"Cultivo {crop_id}",
+            user_id="123",
+            crop_type_id="123",
+            water_stored=75.0,
+            start_date=start_date,
+            last_sim_date=start_date,
+            conditions=[],
+            active=True,
+            consecutive_stress_days=0,
+            current_phase="Fase Inicial",
+        )
+
+    crop_a, crop_b = make_crop("a"), make_crop("b")
+    storage.get_crop_by_id.side_effect = lambda cid: {"a": crop_a, "b": crop_b}[cid]
+    storage.get_crop_type_by_id.return_value = banana_crop_type
+
+    service = CropService(storage)
+    results = service.simulate_batch(
+        ["a", "b"], [27, 26, 28], [100, 90, 95], [12, 11, 12]
+    )
+
+    assert len(results) == 2
+    assert len(crop_a.conditions) == 3
+    assert len(crop_b.conditions) == 3
+    # Both crops share the weather, so their trajectories must match.
+    assert [c.estimated_biomass for c in crop_a.conditions] == [
+        c.estimated_biomass for c in crop_b.conditions
+    ]
+    storage.save_crops_bulk.assert_called_once()
+
+
+"""
+Deferred commits and batched days persist through a real JSONStorage,
+not just a Mock that absorbs missing storage methods.
+"""
+
+
+def test_simulate_deferred_commit_flush_with_real_storage(tmp_path):
+    from src.cultiva_lab.storage import JSONStorage
+
+    storage = JSONStorage(tmp_path / "test_db.json")
+    banana_crop_type = create_valid_crop_type(
+        id="123",
+        name="Cultivo de Bananas",
+        optimal_temp=27.0,
+        minimum_temp=22.0,
+        maximum_temp=32.0,
+        needed_water=100.0,
+        needed_light=12.0,
+        days_cycle=360,
+        activation_energy=50000,
+        initial_biomass=0.75,
+        potential_performance=50.0,
+    )
+    storage.save_crop_type(banana_crop_type)
+    storage.save_user(User("123", "nikoloko", "hashed_pwd", UserRole.USER, []))
+
+    service = CropService(storage)
+    crop = service.create_crop(
+        "Cultivo de Bananas", "123", 75.0, "123", datetime.now()
+    )
+
+    # Two deferred days plus a flush: one bulk write, nothing lost.
+    service.simulate_day(crop.id, "123", 27, 100, 12, commit=False)
+    service.simulate_day(crop.id, "123", 26, 90, 11, commit=False)
+    assert len(storage.get_crop_by_id(crop.id).conditions) == 0
+    service.flush()
+    assert len(storage.get_crop_by_id(crop.id).conditions) == 2
+    assert not service._pending_crops and not service._pending_conditions
+
+    # The batched entry point persists against the same real backend.
+    service.simulate_days(crop.id, "123", [28, 27], [95, 100], [12, 12])
+    assert len(storage.get_crop_by_id(crop.id).conditions) == 4
+
+
+"""
+Batched simulation rejects weather series of different lengths.
+"""
+
+
+def test_simulate_days_length_mismatch_fails():
+    storage = Mock()
+    service = CropService(storage)
+    with pytest.raises(InvalidInputError):
+        service.simulate_days("456", "123", [27, 26], [100], [12, 11])
+
+
 """
 Simulate until completing the cycle and verify crop becomes inactive.
 """
@@ -376,6 +548,7 @@ def test_simulate_day_completes_cycle():
     )
     storage.get_crop_by_id.return_value = crop
     storage.get_crop_type_by_id.return_value = banana_crop_type
+    storage.get_crop_and_type.return_value = (crop, banana_crop_type)
     storage.get_user_by_id.return_value = user
 
     service = CropService(storage)
@@ -436,9 +609,10 @@ def test_get_crop_statistics_with_data():
         consecutive_stress_days=0,
         current_phase="Fase Inicial",
     )
-    storage.get_crop_by_id.return_value = crop
+    storage.fetch_authorization_bundle.return_value = AuthorizationBundle(
+        crop, owner, owner
+    )
     storage.get_crop_type_by_id.return_value = banana_crop_type
-    storage.get_user_by_id.return_value = owner
 
     service = CropService(storage)
     stats = service.get_crop_statistics("456", "123")
@@ -485,9 +659,10 @@ def test_get_crop_statistics_no_conditions():
         consecutive_stress_days=0,
         current_phase="Fase Inicial",
     )
-    storage.get_crop_by_id.return_value = crop
+    storage.fetch_authorization_bundle.return_value = AuthorizationBundle(
+        crop, owner, owner
+    )
     storage.get_crop_type_by_id.return_value = banana_crop_type
-    storage.get_user_by_id.return_value = owner
 
     service = CropService(storage)
     stats = service.get_crop_statistics("456", "123")
@@ -628,8 +803,9 @@ def test_update_crop_name_success():
         consecutive_stress_days=0,
         current_phase="Fase Inicial",
     )
-    storage.get_crop_by_id.return_value = crop
-    storage.get_user_by_id.return_value = owner
+    storage.fetch_authorization_bundle.return_value = AuthorizationBundle(
+        crop, owner, owner
+    )
 
     service = CropService(storage)
     updated_crop = service.update_crops(
@@ -661,8 +837,9 @@ def test_update_crop_forbidden_fields_fails():
         consecutive_stress_days=0,
         current_phase="Fase Inicial",
     )
-    storage.get_crop_by_id.return_value = crop
-    storage.get_user_by_id.return_value = owner
+    storage.fetch_authorization_bundle.return_value = AuthorizationBundle(
+        crop, owner, owner
+    )
 
     service = CropService(storage)
     with pytest.raises(InvalidInputError):
@@ -695,8 +872,9 @@ def test_delete_crop_own_allowed():
         consecutive_stress_days=0,
         current_phase="Fase Inicial",
     )
-    storage.get_crop_by_id.return_value = crop
-    storage.get_user_by_id.side_effect = lambda id: owner if id == "123" else None
+    storage.fetch_authorization_bundle.return_value = AuthorizationBundle(
+        crop, owner, owner
+    )
 
     service = CropService(storage)
     service.delete_crop("456", "123")
@@ -728,8 +906,9 @@ def test_delete_crop_other_forbidden():
         consecutive_stress_days=0,
         current_phase="Fase Inicial",
     )
-    storage.get_crop_by_id.return_value = crop
-    storage.get_user_by_id.side_effect = lambda id: owner if id == "123" else other
+    storage.fetch_authorization_bundle.return_value = AuthorizationBundle(
+        crop, other, owner
+    )
 
     service = CropService(storage)
     with pytest.raises(ResourceOwnershipError):
@@ -857,6 +1036,7 @@ def test_get_user_by_id_own_user_allowed():
     owner = User("123", "nikoloko", "hashed_pwd", UserRole.USER, [])
 
     storage.get_user_by_id.side_effect = lambda uid: {"123": owner}.get(uid)
+    storage.get_crops_by_user.return_value = []
 
     service = UserService(storage)
     result = service.get_user_by_id("123", "123")
@@ -901,6 +1081,7 @@ def test_get_user_by_id_admin_can_see_any():
     storage.get_user_by_id.side_effect = lambda uid: {"123": target, "999": admin}.get(
         uid
     )
+    storage.get_crops_by_user.return_value = []
 
     service = UserService(storage)
     result = service.get_user_by_id("123", "999")
@@ -1067,8 +1248,7 @@ def test_register_admin_only_once():
     storage = Mock()
 
     # First admin exists
-    existing_admin = User("123", "admin", "hashed_pwd", UserRole.ADMIN, [])
-    storage.get_users.return_value = [existing_admin]
+    storage.admin_exists.return_value = True
 
     service = UserService(storage)
 
@@ -1083,7 +1263,7 @@ Register admin fails with wrong master key.
 
 def test_register_admin_wrong_key_fails():
     storage = Mock()
-    storage.get_users.return_value = []  # No admin exists
+    storage.admin_exists.return_value = False  # No admin exists
 
     service = UserService(storage)
 
@@ -1098,7 +1278,7 @@ Register admin successfully with correct master key.
 
 def test_register_admin_success():
     storage = Mock()
-    storage.get_users.return_value = []  # No admin exists
+    storage.admin_exists.return_value = False  # No admin exists
     storage.get_user_by_username.return_value = None
 
     service = UserService(storage)
@@ -1410,6 +1590,41 @@ def test_update_crop_type_admin_success():
     storage.save_crop_type.assert_called_once()
 
 
+"""
+Updating a crop type drops it from a wired CropService cache.
+"""
+
+
+def test_update_crop_type_invalidates_crop_service_cache():
+    storage = Mock()
+    user_service = Mock()
+    admin = User("999", "admin", "hashed_pwd", UserRole.ADMIN, [])
+    crop_type = create_valid_crop_type(
+        id="123",
+        name="Cultivo de Bananas",
+        optimal_temp=27.0,
+        minimum_temp=22.0,
+        maximum_temp=32.0,
+        needed_water=100.0,
+        needed_light=12.0,
+        days_cycle=360,
+        activation_energy=50000,
+        initial_biomass=0.75,
+        potential_performance=50.0,
+    )
+    storage.get_user_by_id.return_value = admin
+    storage.get_crop_type_by_id.return_value = crop_type
+    storage.get_crops_by_type.return_value = []
+
+    crop_service = CropService(storage)
+    crop_service._crop_type_cache["123"] = crop_type
+
+    service = CropTypeService(storage, user_service, crop_service)
+    service.update_crop_type("999", "123", potential_performance=60)
+
+    assert "123" not in crop_service._crop_type_cache
+
+
 """
 Cannot update a crop type that has active crops using it.
 """
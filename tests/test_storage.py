@@ -1,3 +1,7 @@
+import shutil
+
+import pytest
+
 from src.cultiva_lab.storage import JSONStorage
 from src.cultiva_lab.models import User, Crop, CropType, UserRole
 from datetime import datetime
@@ -79,6 +83,25 @@ def create_valid_crop_type(
     )
 
 
+@pytest.fixture(scope="session")
+def empty_db_template(tmp_path_factory):
+    """
+    Materializes the empty database structure once per session; each
+    test clones it instead of re-running the first-write setup.
+    """
+    template = tmp_path_factory.mktemp("template") / "empty.json"
+    storage = JSONStorage(template)
+    storage.save(storage.read())
+    return template
+
+
+@pytest.fixture
+def storage(tmp_path, empty_db_template):
+    destination = tmp_path / "test_db.json"
+    shutil.copy(empty_db_template, destination)
+    return JSONStorage(destination)
+
+
 def test_read_returns_empty_dict_when_file_dont_exists(tmp_path):
     temp_file = tmp_path / "test_db.json"
     assert not temp_file.exists()
@@ -89,10 +112,7 @@ def test_read_returns_empty_dict_when_file_dont_exists(tmp_path):
     assert result == {"users": [], "crops": [], "crop_types": []}
 
 
-def test_save_and_get_users(tmp_path):
-    temp_file = tmp_path / "test_db.json"
-    storage = JSONStorage(temp_file)
-
+def test_save_and_get_users(storage):
     user = User("123", "Nicolás", "hashed_pwd", UserRole.USER, [])
     storage.save_user(user)
 
@@ -104,10 +124,7 @@ def test_save_and_get_users(tmp_path):
     assert users[0].role == user.role
 
 
-def test_save_user_updates_existing_instead_of_duplicate(tmp_path):
-    temp_file = tmp_path / "test_db.json"
-    storage = JSONStorage(temp_file)
-
+def test_save_user_updates_existing_instead_of_duplicate(storage):
     user = User("123", "nikoloko", "hashed_pwd", UserRole.USER, [])
     storage.save_user(user)
 
@@ -122,10 +139,7 @@ def test_save_user_updates_existing_instead_of_duplicate(tmp_path):
     assert users[0].role == evaluating_user.role
 
 
-def test_delete_user_removes_from_storage(tmp_path):
-    temp_file = tmp_path / "test_db.json"
-    storage = JSONStorage(temp_file)
-
+def test_delete_user_removes_from_storage(storage):
     user1 = User("123", "nikoloko", "hashed_pwd", UserRole.USER, [])
     storage.save_user(user1)
 
@@ -145,10 +159,7 @@ def test_delete_user_removes_from_storage(tmp_path):
     assert updated_users[0].password_hash == user2.password_hash
 
 
-def test_get_user_by_id_works_and_returns_none_if_not_found(tmp_path):
-    temp_path = tmp_path / "test_db.json"
-    storage = JSONStorage(temp_path)
-
+def test_get_user_by_id_works_and_returns_none_if_not_found(storage):
     user1 = User("123", "nikoloko", "hashed_pwd", UserRole.USER, [])
     storage.save_user(user1)
 
@@ -159,10 +170,7 @@ def test_get_user_by_id_works_and_returns_none_if_not_found(tmp_path):
     assert storage.get_user_by_id("4567") is None
 
 
-def test_get_user_by_username_works_and_returns_none_if_not_found(tmp_path):
-    temp_path = tmp_path / "test_db.json"
-    storage = JSONStorage(temp_path)
-
+def test_get_user_by_username_works_and_returns_none_if_not_found(storage):
     user1 = User("123", "nikoloko", "hashed_pwd", UserRole.USER, [])
     storage.save_user(user1)
 
@@ -173,10 +181,7 @@ def test_get_user_by_username_works_and_returns_none_if_not_found(tmp_path):
     assert storage.get_user_by_username("catima") is None
 
 
-def test_save_and_get_crops(tmp_path):
-    temp_path = tmp_path / "test_db.json"
-    storage = JSONStorage(temp_path)
-
+def test_save_and_get_crops(storage):
     user1 = User("123", "nikoloko", "hashed_pwd", UserRole.USER, [])
     storage.save_user(user1)
 
@@ -217,10 +222,7 @@ def test_save_and_get_crops(tmp_path):
     assert crops[0].name == crop.name
 
 
-def test_save_crop_updates_existing_instead_of_duplicate(tmp_path):
-    temp_file = tmp_path / "test_db.json"
-    storage = JSONStorage(temp_file)
-
+def test_save_crop_updates_existing_instead_of_duplicate(storage):
     user1 = User("123", "nikoloko", "hashed_pwd", UserRole.USER, [])
     storage.save_user(user1)
 
@@ -277,10 +279,7 @@ def test_save_crop_updates_existing_instead_of_duplicate(tmp_path):
     assert crops[0].user_id == evaluating_crop.user_id
 
 
-def test_delete_crop_removes_from_storage(tmp_path):
-    temp_file = tmp_path / "test_db.json"
-    storage = JSONStorage(temp_file)
-
+def test_delete_crop_removes_from_storage(storage):
     user1 = User("123", "nikoloko", "hashed_pwd", UserRole.USER, [])
     storage.save_user(user1)
 
@@ -342,10 +341,7 @@ def test_delete_crop_removes_from_storage(tmp_path):
     assert updated_crops[0].name == crop2.name
 
 
-def test_get_crop_by_id_works_and_returns_none_if_not_found(tmp_path):
-    temp_path = tmp_path / "test_db.json"
-    storage = JSONStorage(temp_path)
-
+def test_get_crop_by_id_works_and_returns_none_if_not_found(storage):
     user1 = User("123", "nikoloko", "hashed_pwd", UserRole.USER, [])
     storage.save_user(user1)
 
@@ -387,10 +383,7 @@ def test_get_crop_by_id_works_and_returns_none_if_not_found(tmp_path):
     assert storage.get_crop_by_id("4567") is None
 
 
-def test_get_crops_by_user_returns_only_that_user_crops(tmp_path):
-    temp_path = tmp_path / "test_db.json"
-    storage = JSONStorage(temp_path)
-
+def test_get_crops_by_user_returns_only_that_user_crops(storage):
     user1 = User("123", "nikoloko", "hashed_pwd", UserRole.USER, [])
     storage.save_user(user1)
     user2 = User("1234", "catima", "hashed_pwd", UserRole.USER, [])
@@ -448,10 +441,7 @@ def test_get_crops_by_user_returns_only_that_user_crops(tmp_path):
     assert user1_crops[0].name == crop1.name
 
 
-def test_get_crops_by_type_returns_only_crops_of_that_type(tmp_path):
-    temp_path = tmp_path / "test_db.json"
-    storage = JSONStorage(temp_path)
-
+def test_get_crops_by_type_returns_only_crops_of_that_type(storage):
     user1 = User("123", "nikoloko", "hashed_pwd", UserRole.USER, [])
     storage.save_user(user1)
 
@@ -524,10 +514,7 @@ def test_get_crops_by_type_returns_only_crops_of_that_type(tmp_path):
     assert apple_crops[0].id == crop2.id
 
 
-def test_get_active_crops_only_returns_active_crops(tmp_path):
-    temp_path = tmp_path / "test_db.json"
-    storage = JSONStorage(temp_path)
-
+def test_get_active_crops_only_returns_active_crops(storage):
     user = User("123", "nikoloko", "hashed_pwd", UserRole.USER, [])
     storage.save_user(user)
 
@@ -600,10 +587,7 @@ def test_get_active_crops_only_returns_active_crops(tmp_path):
     assert crop3.id in active_ids
 
 
-def test_save_and_get_crop_types(tmp_path):
-    temp_path = tmp_path / "test_db.json"
-    storage = JSONStorage(temp_path)
-
+def test_save_and_get_crop_types(storage):
     banana_crop_type = create_valid_crop_type(
         id="123",
         name="Cultivo de Bananas",
@@ -625,10 +609,7 @@ def test_save_and_get_crop_types(tmp_path):
     assert crop_types[0].name == banana_crop_type.name
 
 
-def test_save_crop_type_updates_instead_of_duplicate(tmp_path):
-    temp_path = tmp_path / "test_db.json"
-    storage = JSONStorage(temp_path)
-
+def test_save_crop_type_updates_instead_of_duplicate(storage):
     banana_crop_type = create_valid_crop_type(
         id="123",
         name="Cultivo de Bananas",
@@ -665,10 +646,7 @@ def test_save_crop_type_updates_instead_of_duplicate(tmp_path):
     assert crop_types_created[0].minimum_temp == new_crop_type.minimum_temp
 
 
-def test_delete_crop_type_removes_from_storage(tmp_path):
-    temp_path = tmp_path / "test_db.json"
-    storage = JSONStorage(temp_path)
-
+def test_delete_crop_type_removes_from_storage(storage):
     banana_crop_type = create_valid_crop_type(
         id="123",
         name="Cultivo de Bananas",
@@ -711,10 +689,7 @@ def test_delete_crop_type_removes_from_storage(tmp_path):
     assert updated_crop_types[0].name == apple_crop_type.name
 
 
-def test_get_crop_type_by_id_works_and_returns_none_if_not_found(tmp_path):
-    temp_path = tmp_path / "test_db.json"
-    storage = JSONStorage(temp_path)
-
+def test_get_crop_type_by_id_works_and_returns_none_if_not_found(storage):
     banana_crop_type = create_valid_crop_type(
         id="123",
         name="Cultivo de Bananas",
@@ -737,10 +712,7 @@ def test_get_crop_type_by_id_works_and_returns_none_if_not_found(tmp_path):
     assert storage.get_crop_type_by_id("4567") is None
 
 
-def test_get_crop_type_by_name_works_and_returns_none_if_not_found(tmp_path):
-    temp_path = tmp_path / "test_db.json"
-    storage = JSONStorage(temp_path)
-
+def test_get_crop_type_by_name_works_and_returns_none_if_not_found(storage):
     banana_crop_type = create_valid_crop_type(
         id="123",
         name="Cultivo de Bananas",
@@ -763,10 +735,123 @@ def test_get_crop_type_by_name_works_and_returns_none_if_not_found(tmp_path):
     assert storage.get_crop_type_by_name("Cultivo de Manzanas") is None
 
 
-def test_storage_maintains_data_integrity_after_multiple_ops(tmp_path):
-    db_file = tmp_path / "test_db.json"
-    storage = JSONStorage(db_file)
+def test_batch_coalesces_writes(tmp_path):
+    temp_file = tmp_path / "test_db.json"
+    storage = JSONStorage(temp_file)
+
+    with storage.batch():
+        storage.save_user(User("123", "nikoloko", "hashed_pwd", UserRole.USER, []))
+        storage.save_user(User("1234", "catima", "hashed_pwd", UserRole.USER, []))
+        # Inside the batch nothing has reached the disk yet...
+        assert not temp_file.exists()
+        # ...but reads through the same storage already see the data.
+        assert len(storage.get_users()) == 2
+
+    # One flush on exit persists everything.
+    assert temp_file.exists()
+    assert len(JSONStorage(temp_file).get_users()) == 2
+
+
+def test_reads_are_served_from_cache_while_mtime_is_unchanged(tmp_path):
+    import os
+
+    temp_file = tmp_path / "test_db.json"
+    storage = JSONStorage(temp_file)
+    storage.save_user(User("123", "nikoloko", "hashed_pwd", UserRole.USER, []))
+
+    # Corrupt the file on disk (same length) and restore its mtime, so
+    # the change signature is identical: the storage must keep serving
+    # the parsed image from memory without re-reading.
+    stat = temp_file.stat()
+    temp_file.write_bytes(b"x" * stat.st_size)
+    os.utime(temp_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    assert storage.get_user_by_id("123") is not None
+    assert len(storage.get_users()) == 1
+
+
+def test_sqlite_storage_round_trip(tmp_path):
+    from src.cultiva_lab.sqlite_storage import SQLiteStorage
+
+    storage = SQLiteStorage(tmp_path / "test_db.sqlite")
+
+    user = User("123", "nikoloko", "hashed_pwd", UserRole.USER, [])
+    storage.save_user(user)
+    assert storage.get_user_by_id("123").username == "nikoloko"
+    assert storage.get_user_by_username("nikoloko").id == "123"
+    assert storage.user_exists("123") and not storage.user_exists("999")
+    assert not storage.admin_exists()
+
+    banana_crop_type = create_valid_crop_type(
+        id="123",
+        name="Cultivo de Bananas",
+        optimal_temp=27.0,
+        minimum_temp=22.0,
+        maximum_temp=32.0,
+        needed_water=100.0,
+        needed_light=12.0,
+        days_cycle=360,
+        activation_energy=50000,
+        initial_biomass=0.75,
+        potential_performance=50.0,
+    )
+    storage.save_crop_type(banana_crop_type)
+    assert storage.get_crop_type_by_id("123").name == "Cultivo de Bananas"
+    assert storage.get_crop_type_by_name("cultivo de bananas") is not None
+
+    now = datetime.now()
+    crop = Crop(
+        id="c1",
+        name="Cultivo de Bananas",
+        user_id="123",
+        crop_type_id="123",
+        start_date=now,
+        water_stored=85.0,
+        last_sim_date=now,
+        conditions=[],
+        active=True,
+        consecutive_stress_days=0,
+        current_phase="Fase Inicial",
+    )
+    storage.save_crop(crop)
+
+    stored_crop, stored_type = storage.get_crop_and_type("c1")
+    assert stored_crop.id == "c1"
+    assert stored_type.id == "123"
+    assert len(storage.get_crops_by_user("123")) == 1
+    assert len(storage.get_active_crops()) == 1
+
+    storage.delete_crop("c1")
+    assert storage.get_crop_by_id("c1") is None
+
+
+def test_jsonl_storage_appends_and_replays(tmp_path):
+    from src.cultiva_lab.storage import JSONLinesStorage
+
+    log_file = tmp_path / "test_db.jsonl"
+    storage = JSONLinesStorage(log_file)
+
+    storage.save_user(User("123", "nikoloko", "hashed_pwd", UserRole.USER, []))
+    storage.save_user(User("1234", "catima", "hashed_pwd", UserRole.USER, []))
+    storage.save_user(User("123", "nikoloko07", "hashed_pwd", UserRole.USER, []))
+    storage.delete_user("1234")
+
+    # One op per line, no full rewrites.
+    assert len(log_file.read_bytes().splitlines()) == 4
+
+    # A fresh instance replays the log into the same state.
+    replayed = JSONLinesStorage(log_file)
+    users = replayed.get_users()
+    assert len(users) == 1
+    assert users[0].username == "nikoloko07"
+
+    # Compaction folds everything into a single snapshot line.
+    replayed.compact()
+    assert len(log_file.read_bytes().splitlines()) == 1
+    assert JSONLinesStorage(log_file).get_user_by_id("123") is not None
+
 
+def test_storage_maintains_data_integrity_after_multiple_ops(storage):
     user1 = User("123", "nico", "hash1", UserRole.USER, crop_ids=[])
     storage.save_user(user1)
     user2 = User("1234", "catima", "hash2", UserRole.ADMIN, crop_ids=[])